@@ -1,8 +1,15 @@
 from datetime import datetime, timedelta
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
+import asyncio
+import hashlib
+import os
+import time
+
+from backend.cache import LRUCache
 
 # 패스워드 해싱 설정
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -12,6 +19,16 @@ SECRET_KEY = "your-secret-key-here-change-in-production"  # 실제 운영환경
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# 검증 완료 토큰 캐시 설정 (토큰 다이제스트 -> 페이로드, exp까지만 유지)
+TOKEN_CACHE_ENABLED = os.getenv("TOKEN_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+TOKEN_CACHE_MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000"))
+
+verified_token_cache = LRUCache(
+    max_size=TOKEN_CACHE_MAX_SIZE,
+    ttl_seconds=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    enabled=TOKEN_CACHE_ENABLED
+)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     평문 패스워드와 해시된 패스워드를 비교합니다.
@@ -24,6 +41,74 @@ def get_password_hash(password: str) -> str:
     """
     return pwd_context.hash(password)
 
+# bcrypt 전용 워커 풀 설정
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "32"))
+
+class PasswordHashPool:
+    """
+    bcrypt 해싱/검증을 이벤트 루프 밖에서 실행하는 크기 제한 스레드 풀입니다.
+    실행 중 + 대기 중인 작업이 한도를 넘으면 429로 거부합니다.
+    """
+    
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._pending = 0  # 이벤트 루프 스레드에서만 변경됨
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+    
+    async def run(self, func, *args):
+        """
+        풀에서 func(*args)를 실행하고 결과를 반환합니다.
+        """
+        if self._pending >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요",
+                headers={"Retry-After": "1"},
+            )
+        
+        self._pending += 1
+        self.peak_pending = max(self.peak_pending, self._pending)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+            self.completed += 1
+    
+    def get_stats(self) -> dict:
+        """
+        풀 사용 현황(대기열 깊이 등)을 반환합니다.
+        """
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": min(self._pending, self.max_workers),
+            "queue_depth": max(0, self._pending - self.max_workers),
+            "peak_pending": self.peak_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+password_hash_pool = PasswordHashPool(PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_QUEUE)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    verify_password를 bcrypt 워커 풀에서 실행합니다.
+    """
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    get_password_hash를 bcrypt 워커 풀에서 실행합니다.
+    """
+    return await password_hash_pool.run(get_password_hash, password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """
     JWT 액세스 토큰을 생성합니다.
@@ -41,7 +126,13 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
 def verify_token(token: str) -> dict:
     """
     JWT 토큰을 검증하고 페이로드를 반환합니다.
+    이미 검증된 토큰은 만료 시각(exp)까지 캐시에서 바로 반환합니다.
     """
+    token_digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    cached_payload = verified_token_cache.get(token_digest)
+    if cached_payload is not None:
+        return dict(cached_payload)
+    
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username = payload.get("sub")
@@ -51,6 +142,13 @@ def verify_token(token: str) -> dict:
                 detail="토큰이 유효하지 않습니다",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+        
+        # exp가 있는 토큰만 남은 유효 시간 동안 캐시
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            remaining = exp - time.time()
+            if remaining > 0:
+                verified_token_cache.set(token_digest, dict(payload), ttl_seconds=remaining)
         return payload
     except JWTError:
         raise HTTPException(
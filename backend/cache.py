@@ -0,0 +1,422 @@
+import os
+import json
+import time
+import asyncio
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+
+from bson import json_util
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis 패키지는 CACHE_BACKEND=redis 사용 시에만 필요
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+# 설정값
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").lower()  # memory | redis
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+CACHE_INVALIDATION_CHANNEL = os.getenv("CACHE_INVALIDATION_CHANNEL", "cache:invalidate")
+# 무효화 직후 이 시간 동안은 해당 키를 다시 저장하지 않음 (무효화 전에 DB에서 읽은 이전 값이 덮어쓰는 것 방지)
+CACHE_INVALIDATION_GRACE_SECONDS = float(os.getenv("CACHE_INVALIDATION_GRACE_SECONDS", "5"))
+
+POST_CACHE_ENABLED = os.getenv("POST_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+POST_CACHE_MAX_SIZE = int(os.getenv("POST_CACHE_MAX_SIZE", "1024"))
+POST_CACHE_TTL_SECONDS = float(os.getenv("POST_CACHE_TTL_SECONDS", "60"))
+
+USER_CACHE_ENABLED = os.getenv("USER_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", "4096"))
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "300"))
+
+# Redis에서 무효화된 키에 잠시 남겨 두는 표식 (json_util.dumps 결과와 겹치지 않는 값)
+_TOMBSTONE = "__invalidated__"
+
+def _is_tombstone(raw) -> bool:
+    return raw == _TOMBSTONE or raw == _TOMBSTONE.encode()
+
+class LRUCache:
+    """크기 제한과 TTL을 지원하는 프로세스 내 LRU 캐시"""
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 60.0, enabled: bool = True,
+                 invalidation_grace_seconds: float = 0.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.invalidation_grace_seconds = invalidation_grace_seconds
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (만료 시각, 값)
+        self._blocked: dict = {}  # key -> 재저장 금지 만료 시각 (무효화 직후)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (없거나 만료되었으면 None)"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None):
+        """캐시 저장 (최대 크기 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        if not self.enabled or self.max_size <= 0:
+            return
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            now = time.monotonic()
+            blocked_until = self._blocked.get(key)
+            if blocked_until is not None:
+                if blocked_until > now:
+                    # 무효화 직후라 이전에 읽은 값일 수 있으므로 저장하지 않음
+                    return
+                del self._blocked[key]
+            self._data[key] = (now + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: str):
+        """특정 키 무효화 (invalidation_grace_seconds 동안 재저장 금지)"""
+        with self._lock:
+            self._data.pop(key, None)
+            if self.invalidation_grace_seconds > 0:
+                now = time.monotonic()
+                if len(self._blocked) > self.max_size:
+                    # 만료된 재저장 금지 항목 정리
+                    self._blocked = {k: until for k, until in self._blocked.items() if until > now}
+                self._blocked[key] = now + self.invalidation_grace_seconds
+
+    def clear(self):
+        """전체 캐시 비우기"""
+        with self._lock:
+            self._data.clear()
+            self._blocked.clear()
+
+    def get_stats(self) -> dict:
+        """캐시 통계 반환"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0
+            }
+
+class CacheBackend(ABC):
+    """네임스페이스 단위 캐시 백엔드 공통 인터페이스
+
+    DB에서 읽은 값을 set 하는 사이에 delete가 일어나면 이전 값이 다시 캐시될 수 있으므로,
+    구현체는 delete 직후 일정 시간(CACHE_INVALIDATION_GRACE_SECONDS) 동안 같은 키의 set을 무시한다.
+    """
+
+    name = "base"
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (없으면 None)"""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any):
+        """캐시 저장 (무효화 직후에는 저장하지 않을 수 있음)"""
+
+    async def get_many(self, keys: list) -> dict:
+        """여러 키를 한 번에 조회 (찾은 키만 담은 dict 반환)"""
+        found = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def set_many(self, items: dict):
+        """여러 키를 한 번에 저장"""
+        for key, value in items.items():
+            await self.set(key, value)
+
+    @abstractmethod
+    async def delete(self, *keys: str):
+        """키 무효화 (다른 워커에도 전파)"""
+
+    async def close(self):
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> dict:
+        """캐시 통계 반환"""
+
+class InMemoryCacheBackend(CacheBackend):
+    """프로세스 내 LRU 캐시 백엔드 (워커 1개일 때 사용)"""
+
+    name = "memory"
+
+    def __init__(self, namespace: str, max_size: int, ttl_seconds: float, enabled: bool = True):
+        super().__init__(namespace)
+        self.local = LRUCache(max_size=max_size, ttl_seconds=ttl_seconds, enabled=enabled,
+                              invalidation_grace_seconds=CACHE_INVALIDATION_GRACE_SECONDS)
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self.local.get(key)
+
+    async def set(self, key: str, value: Any):
+        self.local.set(key, value)
+
+    async def set_many(self, items: dict):
+        for key, value in items.items():
+            self.local.set(key, value)
+
+    async def delete(self, *keys: str):
+        for key in keys:
+            self.local.invalidate(key)
+
+    def get_stats(self) -> dict:
+        return {"backend": self.name, "namespace": self.namespace, **self.local.get_stats()}
+
+class RedisCacheBackend(CacheBackend):
+    """Redis 호환 공유 캐시 백엔드
+
+    워커별 로컬 LRU(L1) 앞단 + Redis 공유 저장소 구조이며, 쓰기 시 pub/sub 채널로
+    무효화 메시지를 브로드캐스트해 모든 워커가 L1에서 오래된 항목을 제거한다.
+    delete는 키를 지우는 대신 짧은 TTL의 무효화 표식을 남기고, set은 SET NX로 저장하므로
+    무효화 전에 읽은 이전 값이 무효화 뒤에 다시 저장되지 않는다.
+    client에는 redis.asyncio.Redis 호환 객체(fakeredis 등)를 넘길 수 있다.
+    """
+
+    name = "redis"
+
+    def __init__(self, namespace: str, client, max_size: int, ttl_seconds: float,
+                 enabled: bool = True, channel: str = CACHE_INVALIDATION_CHANNEL):
+        super().__init__(namespace)
+        self.client = client
+        self.channel = channel
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.local = LRUCache(max_size=max_size, ttl_seconds=ttl_seconds, enabled=enabled,
+                              invalidation_grace_seconds=CACHE_INVALIDATION_GRACE_SECONDS)
+        self._listener_task: Optional[asyncio.Task] = None
+        self.remote_hits = 0
+        self.remote_misses = 0
+        self.errors = 0
+        self.invalidations_received = 0
+
+    def _redis_key(self, key: str) -> str:
+        return f"cache:{self.namespace}:{key}"
+
+    def _ensure_listener(self):
+        """무효화 메시지 구독 태스크를 현재 이벤트 루프에서 시작"""
+        if self._listener_task is not None and not self._listener_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._listener_task = loop.create_task(self._listen())
+
+    async def _listen(self):
+        """다른 워커가 보낸 무효화 메시지를 받아 L1에서 제거"""
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                # 구독 전 놓친 메시지가 있을 수 있으므로 L1 초기화
+                self.local.clear()
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    data = json.loads(message["data"])
+                    if data.get("namespace") != self.namespace:
+                        continue
+                    for key in data.get("keys", []):
+                        self.local.invalidate(key)
+                    self.invalidations_received += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                self.local.clear()
+                logger.warning(f"캐시 무효화 구독 오류 ({self.namespace}): {e}")
+                await asyncio.sleep(1)
+            finally:
+                try:
+                    await pubsub.reset()
+                except Exception:
+                    pass
+
+    async def get(self, key: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        self._ensure_listener()
+
+        value = self.local.get(key)
+        if value is not None:
+            return value
+
+        try:
+            raw = await self.client.get(self._redis_key(key))
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Redis 캐시 조회 실패 ({self.namespace}): {e}")
+            return None
+
+        if raw is None or _is_tombstone(raw):
+            self.remote_misses += 1
+            return None
+
+        self.remote_hits += 1
+        value = json_util.loads(raw)
+        self.local.set(key, value)
+        return value
+
+    async def get_many(self, keys: list) -> dict:
+        """L1에서 먼저 찾고 나머지는 MGET 한 번으로 조회"""
+        if not self.enabled or not keys:
+            return {}
+        self._ensure_listener()
+
+        found = {}
+        missing = []
+        for key in keys:
+            value = self.local.get(key)
+            if value is not None:
+                found[key] = value
+            else:
+                missing.append(key)
+        if not missing:
+            return found
+
+        try:
+            raws = await self.client.mget([self._redis_key(key) for key in missing])
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Redis 캐시 조회 실패 ({self.namespace}): {e}")
+            return found
+
+        for key, raw in zip(missing, raws):
+            if raw is None or _is_tombstone(raw):
+                self.remote_misses += 1
+                continue
+            self.remote_hits += 1
+            value = json_util.loads(raw)
+            self.local.set(key, value)
+            found[key] = value
+        return found
+
+    async def set(self, key: str, value: Any):
+        if not self.enabled:
+            return
+        self._ensure_listener()
+
+        try:
+            # 무효화 표식이나 다른 워커가 저장한 값이 있으면 덮어쓰지 않음
+            stored = await self.client.set(
+                self._redis_key(key),
+                json_util.dumps(value),
+                ex=max(1, int(self.ttl_seconds)),
+                nx=True
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Redis 캐시 저장 실패 ({self.namespace}): {e}")
+            return
+        if stored:
+            self.local.set(key, value)
+
+    async def set_many(self, items: dict):
+        """파이프라인 한 번으로 여러 키를 SET NX (무효화 표식이나 기존 값은 덮어쓰지 않음)"""
+        if not self.enabled or not items:
+            return
+        self._ensure_listener()
+
+        ttl = max(1, int(self.ttl_seconds))
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(self._redis_key(key), json_util.dumps(value), ex=ttl, nx=True)
+                results = await pipe.execute()
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Redis 캐시 저장 실패 ({self.namespace}): {e}")
+            return
+        for (key, value), stored in zip(items.items(), results):
+            if stored:
+                self.local.set(key, value)
+
+    async def delete(self, *keys: str):
+        if not keys:
+            return
+        for key in keys:
+            self.local.invalidate(key)
+        try:
+            grace = max(1, int(CACHE_INVALIDATION_GRACE_SECONDS))
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.set(self._redis_key(key), _TOMBSTONE, ex=grace)
+                await pipe.execute()
+            await self.client.publish(
+                self.channel,
+                json.dumps({"namespace": self.namespace, "keys": list(keys)})
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Redis 캐시 무효화 실패 ({self.namespace}): {e}")
+
+    async def close(self):
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            self._listener_task = None
+
+    def get_stats(self) -> dict:
+        return {
+            "backend": self.name,
+            "namespace": self.namespace,
+            "local": self.local.get_stats(),
+            "remote_hits": self.remote_hits,
+            "remote_misses": self.remote_misses,
+            "invalidations_received": self.invalidations_received,
+            "errors": self.errors
+        }
+
+_redis_client = None
+
+def get_redis_client():
+    """공유 Redis 클라이언트 반환 (최초 호출 시 생성)"""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = aioredis.from_url(REDIS_URL, decode_responses=True)
+    return _redis_client
+
+def create_cache(namespace: str, max_size: int, ttl_seconds: float, enabled: bool = True) -> CacheBackend:
+    """CACHE_BACKEND 설정에 맞는 캐시 백엔드 생성"""
+    if CACHE_BACKEND == "redis":
+        if aioredis is None:
+            logger.warning("redis 패키지가 없어 프로세스 내 캐시를 사용합니다")
+        else:
+            return RedisCacheBackend(namespace, get_redis_client(), max_size, ttl_seconds, enabled)
+    return InMemoryCacheBackend(namespace, max_size, ttl_seconds, enabled)
+
+# 전역 캐시 인스턴스
+post_cache = create_cache("posts", POST_CACHE_MAX_SIZE, POST_CACHE_TTL_SECONDS, POST_CACHE_ENABLED)
+user_cache = create_cache("users", USER_CACHE_MAX_SIZE, USER_CACHE_TTL_SECONDS, USER_CACHE_ENABLED)
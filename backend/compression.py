@@ -0,0 +1,208 @@
+import os
+import zlib
+import logging
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # brotli 패키지가 없으면 br 인코딩 비활성화
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard 패키지가 없으면 zstd 인코딩 비활성화
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# 설정값
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() in ("1", "true", "yes")
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))  # 이보다 작은 응답은 압축하지 않음 (bytes)
+COMPRESSION_ALGORITHMS = os.getenv("COMPRESSION_ALGORITHMS", "zstd,br,gzip")  # 같은 q값일 때 우선순위
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+ZSTD_LEVEL = int(os.getenv("ZSTD_LEVEL", "3"))
+
+# 압축 대상 Content-Type (이미지 등 이미 압축된 형식은 제외)
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+
+class _GzipEncoder:
+    def __init__(self):
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # wbits 31 = gzip 헤더 포함
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+class _BrotliEncoder:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+class _ZstdEncoder:
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+# Content-Encoding 이름 -> 인코더 (설치된 라이브러리만)
+ENCODERS = {"gzip": _GzipEncoder}
+if brotli is not None:
+    ENCODERS["br"] = _BrotliEncoder
+if zstandard is not None:
+    ENCODERS["zstd"] = _ZstdEncoder
+
+def select_encoding(accept_encoding: str, algorithms: list) -> Optional[str]:
+    """Accept-Encoding에서 q값이 가장 높은 인코딩 선택 (같으면 algorithms 순서 우선, q=0은 제외)"""
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                continue
+        weights[name] = q
+
+    best = None
+    best_q = 0.0
+    for algorithm in algorithms:
+        q = weights.get(algorithm, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = algorithm, q
+    return best
+
+def _is_compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+class CompressionMiddleware:
+    """응답 압축 ASGI 미들웨어 (zstd/br/gzip, 최소 크기 기준, 스트리밍 응답 지원)
+
+    단일 본문 응답은 최소 크기 이상일 때만 압축하고, 스트리밍 응답은 청크마다 flush 하여
+    클라이언트가 압축된 데이터를 바로 받을 수 있게 한다. 인코딩을 협상한 요청에서는 압축 대상
+    응답과 304 응답 모두 ETag를 약한(W/) ETag로 바꾸고 Vary: Accept-Encoding을 추가해,
+    압축 여부(크기 기준)와 관계없이 같은 리소스의 200과 304가 같은 ETag를 갖게 한다.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE, algorithms: Optional[str] = None):
+        self.app = app
+        self.minimum_size = minimum_size
+        requested = [name.strip() for name in (algorithms or COMPRESSION_ALGORITHMS).split(",") if name.strip()]
+        self.algorithms = [name for name in requested if name in ENCODERS]
+        unavailable = [name for name in requested if name not in ENCODERS]
+        if unavailable:
+            logger.info(f"압축 라이브러리가 없어 비활성화된 인코딩: {unavailable}")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not COMPRESSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""), self.algorithms)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await _CompressionResponder(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+class _CompressionResponder:
+    """요청 하나의 응답을 받아 압축 여부를 결정하고 압축해서 전송"""
+
+    def __init__(self, app, encoding: str, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send = None
+        self.start_message = None
+        self.encoder = None
+        self.passthrough = False
+
+    async def __call__(self, scope, receive, send):
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message):
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            headers = MutableHeaders(raw=message["headers"])
+            if message["status"] == 304 or _is_compressible(headers):
+                # 인코딩에 따라 바이트가 달라질 수 있는 표현이므로 약한 ETag로 통일
+                headers.add_vary_header("Accept-Encoding")
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+            # 본문 첫 청크를 보고 압축 여부를 정하기 위해 시작 메시지를 보류
+            self.start_message = message
+            return
+        if message_type != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.encoder is None:
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            if not _is_compressible(headers):
+                self.passthrough = True
+                await self.send(self.start_message)
+                await self.send(message)
+                return
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self.send(self.start_message)
+                await self.send(message)
+                return
+
+            self.encoder = ENCODERS[self.encoding]()
+            headers["Content-Encoding"] = self.encoding
+            if more_body:
+                # 스트리밍 응답은 최종 길이를 알 수 없으므로 chunked 전송
+                del headers["Content-Length"]
+            else:
+                body = self.encoder.compress(body) + self.encoder.finish()
+                headers["Content-Length"] = str(len(body))
+                await self.send(self.start_message)
+                await self.send({"type": "http.response.body", "body": body})
+                return
+            await self.send(self.start_message)
+
+        # 스트리밍 청크는 바로 전달되도록 청크마다 flush
+        data = self.encoder.compress(body) + (self.encoder.flush() if more_body else self.encoder.finish())
+        await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
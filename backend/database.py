@@ -1,7 +1,13 @@
-from pymongo import MongoClient
+from pymongo import MongoClient, ReturnDocument, ASCENDING
+from pymongo.errors import DuplicateKeyError, PyMongoError
 from dotenv import load_dotenv
+from typing import Optional
+import threading
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
 # .env 파일에서 환경변수 로드
 load_dotenv()
 
@@ -13,15 +19,75 @@ db = client['mini_project']  # 데이터베이스 이름
 users = db['users']  # 사용자 컬렉션
 counters = db['counters']  # ID 카운터 컬렉션
 
-def get_next_user_id():
-    """다음 사용자 ID를 생성합니다 (1, 2, 3, ...)"""
-    result = counters.find_one_and_update(
-        {"_id": "user_id"},
-        {"$inc": {"sequence_value": 1}},
-        upsert=True,
-        return_document=True
-    )
-    return result["sequence_value"]
+# 한 번에 예약할 사용자 ID 개수
+USER_ID_BLOCK_SIZE = int(os.getenv('USER_ID_BLOCK_SIZE', '20'))
+
+class UserIdAllocator:
+    """hi/lo 방식 ID 할당기
+
+    counters 문서를 block_size만큼 한 번에 증가시켜 ID 구간을 예약하고,
+    구간이 소진될 때까지는 DB 왕복 없이 프로세스 내에서 ID를 발급합니다.
+    프로세스가 재시작되면 쓰지 않은 구간은 버려지므로 ID에 빈 번호가 생길 수 있습니다.
+    """
+
+    def __init__(self, collection, counter_name: str = "user_id", block_size: int = USER_ID_BLOCK_SIZE):
+        self.collection = collection
+        self.counter_name = counter_name
+        self.block_size = max(1, block_size)
+        self._lock = threading.Lock()
+        self._next = 1
+        self._high = 0  # 예약된 구간의 마지막 ID (소진 시 _next > _high)
 
+    def _reserve_block(self):
+        """counters 문서를 block_size만큼 증가시키고 새 구간을 예약"""
+        result = self.collection.find_one_and_update(
+            {"_id": self.counter_name},
+            {"$inc": {"sequence_value": self.block_size}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        self._high = result["sequence_value"]
+        self._next = self._high - self.block_size + 1
+
+    def next_id(self) -> int:
+        """다음 ID 반환"""
+        with self._lock:
+            if self._next > self._high:
+                self._reserve_block()
+            value = self._next
+            self._next += 1
+            return value
+
+user_id_allocator = UserIdAllocator(counters)
+
+def get_next_user_id():
+    """다음 사용자 ID를 생성합니다 (구간 단위로 예약, 빈 번호 허용)"""
+    return user_id_allocator.next_id()
 
+def ensure_user_indexes():
+    """users 컬렉션 고유 인덱스 생성 (애플리케이션 시작 시 호출)"""
+    index_specs = [
+        ("email", {"name": "email_unique", "unique": True}),
+        ("username", {"name": "username_unique", "unique": True}),
+        # ObjectId만 가진 기존 사용자를 위해 id 필드가 있는 문서만 인덱싱
+        ("id", {"name": "id_unique", "unique": True, "sparse": True}),
+    ]
+    for field, options in index_specs:
+        try:
+            users.create_index([(field, ASCENDING)], **options)
+        except PyMongoError as e:
+            # 기존 데이터에 중복 값이 있으면 인덱스 생성 실패
+            logger.error(f"users.{field} 고유 인덱스 생성 실패: {e}")
 
+def duplicate_key_field(error: DuplicateKeyError) -> Optional[str]:
+    """DuplicateKeyError에서 중복된 필드명 추출"""
+    details = error.details or {}
+    key_pattern = details.get("keyPattern") or details.get("keyValue") or {}
+    if key_pattern:
+        return next(iter(key_pattern))
+    # 구버전 서버는 keyPattern이 없으므로 메시지의 인덱스 이름으로 판단
+    message = str(error)
+    for field in ("email", "username", "id"):
+        if f"index: {field}_" in message:
+            return field
+    return None
@@ -2,6 +2,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from backend.routes.auth import router as auth_router
 from backend.post.routes.posts import router as posts_router
+from backend.post.database.mongodb import close_async_mongodb
+from backend.database import ensure_user_indexes
+from backend.compression import CompressionMiddleware
+from backend.post.utils.image_utils import UploadSizeLimitMiddleware, image_utils
 import uvicorn
 
 # FastAPI 애플리케이션 생성 (Swagger UI 설정 포함)
@@ -13,6 +17,23 @@ app = FastAPI(
     redoc_url="/redoc"  # ReDoc 경로
 )
 
+# 애플리케이션 시작 시 users 고유 인덱스 확인
+@app.on_event("startup")
+async def startup_event():
+    """애플리케이션 시작 시 실행"""
+    ensure_user_indexes()
+
+# 애플리케이션 종료 시 파생 이미지 프로세스 풀 및 MongoDB 연결 정리
+@app.on_event("shutdown")
+async def shutdown_event():
+    """애플리케이션 종료 시 실행"""
+    image_utils.shutdown()
+    close_async_mongodb()
+
+# 이미지 업로드 크기 초과 요청은 본문을 받기 전에 413으로 거부
+# (나중에 등록한 미들웨어가 바깥에서 실행되므로 CORS보다 먼저 등록해 413 응답에도 CORS 헤더가 붙게 함)
+app.add_middleware(UploadSizeLimitMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -22,6 +43,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (zstd/br/gzip, COMPRESSION_* 환경변수로 설정)
+app.add_middleware(CompressionMiddleware)
+
 # 라우터 등록
 app.include_router(auth_router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(posts_router, prefix="/api/posts", tags=["Posts"])
@@ -5,8 +5,10 @@ from fastapi.staticfiles import StaticFiles
 import uvicorn
 import os
 
-from routes.posts import router as posts_router
-from database.mongodb import init_mongodb
+from backend.post.routes.posts import router as posts_router
+from backend.post.database.mongodb import init_async_mongodb, close_async_mongodb
+from backend.compression import CompressionMiddleware
+from backend.post.utils.image_utils import UploadSizeLimitMiddleware, image_utils
 
 # FastAPI 애플리케이션 생성
 app = FastAPI(
@@ -29,12 +31,23 @@ async def startup_event():
         os.makedirs(directory, exist_ok=True)
         print(f"[OK] 업로드 폴더 생성: {directory}")
     
-    success = init_mongodb()
+    success = await init_async_mongodb()
     if success:
         print("[OK] MongoDB 연결 성공")
     else:
         print("[WARNING] MongoDB 연결 실패 - 일부 기능이 제한될 수 있습니다")
 
+# 애플리케이션 종료 시 파생 이미지 프로세스 풀 및 MongoDB 연결 정리
+@app.on_event("shutdown")
+async def shutdown_event():
+    """애플리케이션 종료 시 실행"""
+    image_utils.shutdown()
+    close_async_mongodb()
+
+# 이미지 업로드 크기 초과 요청은 본문을 받기 전에 413으로 거부
+# (나중에 등록한 미들웨어가 바깥에서 실행되므로 CORS보다 먼저 등록해 413 응답에도 CORS 헤더가 붙게 함)
+app.add_middleware(UploadSizeLimitMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -44,6 +57,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (zstd/br/gzip, COMPRESSION_* 환경변수로 설정)
+app.add_middleware(CompressionMiddleware)
+
 # 정적 파일 서빙 설정 (업로드된 이미지 파일 제공)
 app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 
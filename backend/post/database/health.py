@@ -0,0 +1,126 @@
+import threading
+import time
+import logging
+from typing import Optional
+
+from pymongo import monitoring
+
+logger = logging.getLogger(__name__)
+
+class ConnectionHealth:
+    """MongoDB 연결 상태 추적 클래스
+
+    드라이버의 백그라운드 heartbeat, 커넥션 풀 이벤트, 실제 쿼리 실패를 기반으로
+    서버별 생존 여부를 기록한다. 라우트는 매 요청마다 ping 하지 않고 이 상태만 확인한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._servers = {}  # 서버 주소 -> 생존 여부
+        self._alive = False
+        self.last_heartbeat: Optional[float] = None
+        self.last_failure: Optional[str] = None
+        self.last_failure_time: Optional[float] = None
+
+    def is_alive(self) -> bool:
+        """하나 이상의 서버가 살아있으면 True"""
+        return self._alive
+
+    def mark_up(self, address=None):
+        """서버(또는 전체 연결)를 정상 상태로 기록"""
+        with self._lock:
+            if address is not None:
+                self._servers[address] = True
+            self._alive = address is None or any(self._servers.values())
+
+    def mark_down(self, reason: str, address=None):
+        """서버(또는 전체 연결)를 장애 상태로 기록"""
+        with self._lock:
+            if address is not None:
+                self._servers[address] = False
+                self._alive = any(self._servers.values())
+            else:
+                self._servers.clear()
+                self._alive = False
+            self.last_failure = reason
+            self.last_failure_time = time.time()
+        logger.warning(f"MongoDB 연결 장애 감지: {reason}")
+
+    def reset(self):
+        """새 클라이언트 생성 시 상태 초기화"""
+        with self._lock:
+            self._servers.clear()
+            self._alive = False
+
+    def get_status(self) -> dict:
+        """현재 연결 상태 정보 반환"""
+        with self._lock:
+            return {
+                "alive": self._alive,
+                "servers": {f"{host}:{port}": up for (host, port), up in self._servers.items()},
+                "last_heartbeat": self.last_heartbeat,
+                "last_failure": self.last_failure,
+                "last_failure_time": self.last_failure_time
+            }
+
+    def listeners(self) -> list:
+        """MongoClient(event_listeners=...)에 등록할 리스너 목록 반환"""
+        return [_HeartbeatListener(self), _PoolListener(self)]
+
+class _HeartbeatListener(monitoring.ServerHeartbeatListener):
+    """드라이버 백그라운드 모니터의 heartbeat 결과 반영"""
+
+    def __init__(self, health: ConnectionHealth):
+        self.health = health
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self.health.last_heartbeat = time.time()
+        if not self.health.is_alive():
+            logger.info(f"MongoDB heartbeat 복구: {event.connection_id}")
+        self.health.mark_up(event.connection_id)
+
+    def failed(self, event):
+        self.health.mark_down(f"heartbeat 실패: {event.reply}", event.connection_id)
+
+class _PoolListener(monitoring.ConnectionPoolListener):
+    """커넥션 풀 이벤트 반영 (네트워크 오류 시 드라이버가 풀을 비움)"""
+
+    def __init__(self, health: ConnectionHealth):
+        self.health = health
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        self.health.mark_up(event.address)
+
+    def pool_cleared(self, event):
+        self.health.mark_down("커넥션 풀 초기화 (네트워크 오류)", event.address)
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        if event.reason == monitoring.ConnectionCheckOutFailedReason.CONN_ERROR:
+            self.health.mark_down("커넥션 획득 실패", event.address)
+
+    def connection_checked_out(self, event):
+        pass
+
+    def connection_checked_in(self, event):
+        pass
@@ -13,10 +13,17 @@ import sys
 import os
 from datetime import datetime
 
-# 현재 디렉토리를 Python 경로에 추가
+# 현재 디렉토리와 저장소 루트를 Python 경로에 추가 (mongodb.py가 backend 패키지를 import 함)
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
+
+from pymongo import UpdateOne
 
 from mongodb import MongoDB
+from backend.post.utils.summary import build_summary
+
+# 요약 필드 백필 시 한 번에 업데이트할 문서 수
+BACKFILL_BATCH_SIZE = 500
 
 # def create_sample_posts(mongodb: MongoDB):
 #     """샘플 글 데이터 생성 - 일기장에서는 사용하지 않음"""
@@ -68,6 +75,30 @@ from mongodb import MongoDB
 #     except Exception as e:
 #         print(f"[ERROR] 샘플 데이터 생성 실패: {e}")
 
+def backfill_summaries(mongodb: MongoDB) -> int:
+    """요약 필드(excerpt, word_count, image_count)가 없는 기존 글에 요약 필드 채우기"""
+    collection = mongodb.get_posts_collection()
+    cursor = collection.find(
+        {"excerpt": {"$exists": False}},
+        {"_id": 1, "content": 1, "images": 1}
+    ).batch_size(BACKFILL_BATCH_SIZE)
+    
+    updated = 0
+    operations = []
+    for doc in cursor:
+        doc.setdefault("content", "")
+        doc.setdefault("images", [])
+        operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": build_summary(doc)}))
+        if len(operations) >= BACKFILL_BATCH_SIZE:
+            updated += collection.bulk_write(operations, ordered=False).modified_count
+            operations = []
+    if operations:
+        updated += collection.bulk_write(operations, ordered=False).modified_count
+    if updated:
+        # 목록 응답 모양이 바뀌었으므로 캐시된 목록 ETag 무효화
+        mongodb.bump_posts_version()
+    return updated
+
 def verify_setup(mongodb: MongoDB):
     """설정 검증"""
     try:
@@ -125,8 +156,8 @@ def main():
         # 2. 컬렉션 및 인덱스 설정 (이미 connect()에서 수행됨)
         print("2. 컬렉션 및 인덱스 설정 완료")
         
-        # 3. 데이터베이스 준비 완료 (샘플 데이터 생성 안함)
-        print("3. 일기장 데이터베이스 준비 완료")
+        # 3. 기존 글 요약 필드 백필 (샘플 데이터 생성 안함)
+        print(f"3. 일기장 데이터베이스 준비 완료 (요약 필드 백필: {backfill_summaries(mongodb)}개 글)")
         
         # 4. 설정 검증
         print("4. 설정 검증 중...")
@@ -1,6 +1,12 @@
 import os
-from pymongo import MongoClient, ASCENDING, DESCENDING
-from pymongo.errors import ConnectionFailure, DuplicateKeyError
+import time
+import asyncio
+from pymongo import MongoClient, ASCENDING, DESCENDING, TEXT
+from pymongo.errors import ConnectionFailure
+from motor.motor_asyncio import AsyncIOMotorClient
+from backend.post.database.health import ConnectionHealth
+from backend.post.utils.search import SEARCH_WEIGHTS
+from backend.post.utils.summary import build_summary
 from typing import Optional
 import logging
 
@@ -8,6 +14,69 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# posts 컬렉션에 유지할 인덱스 (키 스펙 기준으로 기존 인덱스와 비교)
+DESIRED_INDEXES = [
+    # 1. created_at 인덱스 (최신 글 조회, 날짜 범위 조회용)
+    ([("created_at", DESCENDING)], {"name": "created_at_desc"}),
+    # 2. 복합 인덱스: status + created_at + post_id (글 목록/커서 페이지네이션용)
+    #    기존 status, status+created_at 인덱스의 조회도 이 인덱스의 접두사로 처리됨
+    ([("status", ASCENDING), ("created_at", DESCENDING), ("post_id", DESCENDING)],
+     {"name": "status_created_at_post_id"}),
+    # 3. post_id 고유 인덱스 (상세 조회/수정/삭제용)
+    ([("post_id", ASCENDING)], {"name": "post_id_unique", "unique": True}),
+    # 4. 제목/본문 텍스트 인덱스 (전체 텍스트 검색용)
+    #    한국어는 형태소 분석을 지원하지 않으므로 언어를 none으로 두어 어간 추출/불용어 제거를 끔
+    ([("title", TEXT), ("content", TEXT)],
+     {"name": "title_content_text", "default_language": "none", "weights": SEARCH_WEIGHTS}),
+]
+
+def _key_spec(keys, weights: Optional[dict] = None) -> tuple:
+    """인덱스 키를 비교 가능한 형태로 정규화 (서버가 1.0처럼 반환하는 값 보정)
+    
+    텍스트 인덱스는 서버가 키를 _fts/_ftsx로 반환하므로 weights의 필드로 복원하고,
+    텍스트 필드는 순서와 무관하게 비교하도록 정렬한다.
+    """
+    items = keys.items() if hasattr(keys, "items") else keys
+    spec = []
+    text_fields = []
+    for field, direction in items:
+        if field == "_fts":
+            text_fields.extend(weights or {})
+        elif field == "_ftsx":
+            continue
+        elif direction == TEXT:
+            text_fields.append(field)
+        else:
+            spec.append((field, int(direction) if isinstance(direction, (int, float)) else direction))
+    spec.extend((field, TEXT) for field in sorted(text_fields))
+    return tuple(spec)
+
+def _reconcile_indexes(existing_indexes: list) -> tuple:
+    """원하는 인덱스와 기존 인덱스를 키 스펙으로 비교
+    
+    Returns:
+        (생성할 (키, 옵션) 목록, 관리 대상이 아닌 기존 인덱스 이름 목록)
+    """
+    existing_by_key = {_key_spec(index["key"], index.get("weights")): index for index in existing_indexes}
+    desired_keys = set()
+    to_create = []
+    
+    for keys, options in DESIRED_INDEXES:
+        spec = _key_spec(keys)
+        desired_keys.add(spec)
+        existing = existing_by_key.get(spec)
+        if existing is None:
+            to_create.append((keys, options))
+        elif options.get("unique", False) != existing.get("unique", False):
+            # 같은 키의 인덱스가 있지만 옵션이 다르면 자동으로 바꾸지 않고 경고만 남김
+            logger.warning(f"인덱스 옵션 불일치: {existing['name']} (필요 옵션: {options})")
+    
+    unmanaged = [
+        index["name"] for spec, index in existing_by_key.items()
+        if spec not in desired_keys and index["name"] != "_id_"
+    ]
+    return to_create, unmanaged
+
 class MongoDB:
     """MongoDB 연결 및 관리 클래스"""
     
@@ -20,6 +89,10 @@ class MongoDB:
         self.mongodb_url = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
         self.database_name = os.getenv("DATABASE_NAME", "mini_blog")
         self.posts_collection_name = "posts"
+        
+        # 목록 ETag용 컬렉션 버전 카운터 (글이 바뀔 때마다 증가)
+        self.meta_collection = None
+        self.meta_collection_name = "posts_meta"
     
     def connect(self):
         """MongoDB에 연결"""
@@ -33,6 +106,7 @@ class MongoDB:
             # 데이터베이스 선택
             self.db = self.client[self.database_name]
             self.posts_collection = self.db[self.posts_collection_name]
+            self.meta_collection = self.db[self.meta_collection_name]
             
             # 컬렉션 초기화
             self._initialize_collection()
@@ -53,45 +127,34 @@ class MongoDB:
                 logger.error("posts_collection이 초기화되지 않았습니다")
                 return
                 
-            # 기존 인덱스 확인
+            # 기존 인덱스와 비교
             existing_indexes = list(self.posts_collection.list_indexes())
-            index_names = [index['name'] for index in existing_indexes]
-            
-            # 필요한 인덱스들 생성
-            indexes_to_create = []
-            
-            # 1. created_at 인덱스 (최신 글 조회용)
-            if 'created_at_desc' not in index_names:
-                indexes_to_create.append(
-                    ("created_at", DESCENDING)
-                )
+            to_create, unmanaged = _reconcile_indexes(existing_indexes)
             
-            # 2. status 인덱스 (글 상태별 조회용)
-            if 'status_asc' not in index_names:
-                indexes_to_create.append(
-                    ("status", ASCENDING)
-                )
+            # 없는 인덱스만 생성
+            for index, options in to_create:
+                try:
+                    self.posts_collection.create_index(index, **options)
+                    logger.info(f"인덱스 생성: {options['name']} {index}")
+                except Exception as e:
+                    logger.error(f"인덱스 생성 실패: {options['name']}: {e}")
             
-            # 3. 복합 인덱스: status + created_at (효율적인 게시글 목록 조회용)
-            if 'status_created_at_compound' not in index_names:
-                indexes_to_create.append(
-                    [("status", ASCENDING), ("created_at", DESCENDING)]
-                )
-            
-            # 인덱스 생성
-            for index in indexes_to_create:
-                if isinstance(index, tuple):
-                    self.posts_collection.create_index([index])
-                    logger.info(f"인덱스 생성: {index}")
-                else:
-                    self.posts_collection.create_index(index)
-                    logger.info(f"복합 인덱스 생성: {index}")
+            if unmanaged:
+                logger.info(f"관리 대상이 아닌 인덱스 (삭제하지 않음): {unmanaged}")
             
             logger.info("posts 컬렉션 초기화 완료")
             
         except Exception as e:
             logger.error(f"컬렉션 초기화 중 오류: {e}")
     
+    def bump_posts_version(self):
+        """posts 컬렉션 버전 증가 (스크립트에서 글 문서를 직접 고친 뒤 목록 ETag 무효화)"""
+        self.meta_collection.update_one(
+            {"_id": self.posts_collection_name},
+            {"$inc": {"version": 1}},
+            upsert=True
+        )
+    
     def disconnect(self):
         """MongoDB 연결 해제"""
         if self.client:
@@ -114,7 +177,7 @@ class MongoDB:
     
     def create_post_document(self, post_data: dict) -> dict:
         """posts 컬렉션에 맞는 문서 구조 생성"""
-        return {
+        document = {
             "post_id": post_data["id"],  # FastAPI에서 사용하는 id를 post_id로 저장
             "title": post_data["title"],
             "content": post_data["content"],
@@ -123,6 +186,9 @@ class MongoDB:
             "created_at": post_data["created_at"],
             "updated_at": post_data["updated_at"]
         }
+        # 목록 조회에서 본문을 읽지 않도록 요약 필드를 미리 계산해 저장
+        document.update(build_summary(document))
+        return document
     
     def get_database_info(self) -> dict:
         """데이터베이스 정보 반환"""
@@ -146,13 +212,211 @@ class MongoDB:
         except Exception as e:
             return {"error": f"데이터베이스 정보 조회 실패: {e}"}
 
+class AsyncMongoDB(MongoDB):
+    """motor 기반 비동기 MongoDB 연결 및 관리 클래스
+    
+    FastAPI 라우트에서 이벤트 루프를 막지 않도록 모든 DB 호출을 await 할 수 있게 한다.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.client: Optional[AsyncIOMotorClient] = None
+        self.health = ConnectionHealth()
+        # 버전 증가에 실패해 목록 ETag를 믿을 수 없는 상태 (다음 목록 조회 때 다시 증가 시도)
+        self._posts_version_stale = False
+        
+        # 드라이버 백그라운드 heartbeat 주기 (장애 감지 속도)
+        self.heartbeat_frequency_ms = int(os.getenv("MONGODB_HEARTBEAT_MS", "10000"))
+        # 장애 상태에서 연결 확인(ping)을 다시 시도하는 최소 간격 (초)
+        self.reconnect_interval = float(os.getenv("MONGODB_RECONNECT_INTERVAL", "1"))
+        
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._collection_initialized = False
+        self._last_connect_attempt = 0.0
+    
+    def _get_connect_lock(self) -> asyncio.Lock:
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        return self._connect_lock
+    
+    async def connect(self):
+        """MongoDB에 비동기로 연결
+        
+        클라이언트는 한 번만 생성하고 이후에는 교체하지 않는다 (장애 복구는 드라이버가 담당).
+        동시에 호출되어도 lock으로 한 번만 연결/확인하며, 컬렉션 초기화도 최초 성공 시 한 번만 수행한다.
+        """
+        async with self._get_connect_lock():
+            # 기다리는 동안 다른 요청이 연결에 성공했으면 그대로 사용
+            if self.client is not None and self.health.is_alive():
+                return True
+            return await self._connect_locked()
+    
+    async def _connect_locked(self) -> bool:
+        self._last_connect_attempt = time.monotonic()
+        try:
+            if self.client is None:
+                self.health.reset()
+                self.client = AsyncIOMotorClient(
+                    self.mongodb_url,
+                    serverSelectionTimeoutMS=5000,
+                    heartbeatFrequencyMS=self.heartbeat_frequency_ms,
+                    event_listeners=self.health.listeners()
+                )
+                
+                # 데이터베이스 선택
+                self.db = self.client[self.database_name]
+                self.posts_collection = self.db[self.posts_collection_name]
+                self.meta_collection = self.db[self.meta_collection_name]
+            
+            # 연결 테스트
+            await self.client.admin.command('ping')
+            self.health.mark_up()
+            logger.info("MongoDB(async) 연결 성공")
+            
+            # 컬렉션 초기화 (실패했으면 다음 연결 확인 때 다시 시도)
+            if not self._collection_initialized:
+                self._collection_initialized = await self._initialize_collection()
+            
+            return True
+            
+        except ConnectionFailure as e:
+            self.health.mark_down(f"연결 실패: {e}")
+            logger.error(f"MongoDB(async) 연결 실패: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"MongoDB(async) 초기화 중 오류: {e}")
+            return False
+    
+    async def _initialize_collection(self) -> bool:
+        """posts 컬렉션 초기화 및 인덱스 설정 (성공 여부 반환)"""
+        try:
+            if self.posts_collection is None:
+                logger.error("posts_collection이 초기화되지 않았습니다")
+                return False
+            
+            # 기존 인덱스와 비교
+            existing_indexes = await self.posts_collection.list_indexes().to_list(length=None)
+            to_create, unmanaged = _reconcile_indexes(existing_indexes)
+            
+            # 없는 인덱스만 생성
+            for index, options in to_create:
+                try:
+                    await self.posts_collection.create_index(index, **options)
+                    logger.info(f"인덱스 생성: {options['name']} {index}")
+                except Exception as e:
+                    logger.error(f"인덱스 생성 실패: {options['name']}: {e}")
+            
+            if unmanaged:
+                logger.info(f"관리 대상이 아닌 인덱스 (삭제하지 않음): {unmanaged}")
+            
+            logger.info("posts 컬렉션 초기화 완료")
+            return True
+            
+        except Exception as e:
+            logger.error(f"컬렉션 초기화 중 오류: {e}")
+            return False
+    
+    async def check_connection(self) -> bool:
+        """연결 상태 확인 (명시적 ping, 헬스 체크용)"""
+        try:
+            if self.client:
+                await self.client.admin.command('ping')
+                self.health.mark_up()
+                return True
+        except Exception as e:
+            self.health.mark_down(f"ping 실패: {e}")
+        return False
+    
+    async def ensure_connection(self) -> bool:
+        """요청 처리 전 연결 보장
+        
+        ping 없이 heartbeat/풀 이벤트로 추적한 상태만 확인한다.
+        최초 연결 전에는 연결될 때까지 기다리고, 장애 상태에서는 한 요청만 reconnect_interval마다
+        ping으로 복구 여부를 확인하며 나머지 요청은 기다리지 않고 바로 실패한다.
+        """
+        if self.client is not None and self.health.is_alive():
+            return True
+        if self.client is None:
+            return await self.connect()
+        
+        lock = self._get_connect_lock()
+        if lock.locked() or time.monotonic() - self._last_connect_attempt < self.reconnect_interval:
+            return False
+        async with lock:
+            if self.health.is_alive():
+                return True
+            return await self._connect_locked()
+    
+    def report_failure(self, error: Exception):
+        """실제 쿼리 실행 중 발생한 연결 오류 기록"""
+        self.health.mark_down(f"쿼리 실패: {error}")
+    
+    async def get_posts_version(self) -> Optional[int]:
+        """posts 컬렉션 버전 조회 (목록 ETag용, 카운터가 없으면 0)
+        
+        이전 버전 증가가 실패했다면 먼저 다시 증가시키고, 그래도 실패하면 None을 반환해
+        호출 측이 304 없이 목록을 새로 응답하게 한다.
+        """
+        if self._posts_version_stale and not await self.bump_posts_version():
+            return None
+        meta = await self.meta_collection.find_one({"_id": self.posts_collection_name}, {"version": 1})
+        return meta["version"] if meta else 0
+    
+    async def bump_posts_version(self) -> bool:
+        """글 작성/수정/삭제 후 posts 컬렉션 버전 증가 (실패 시 한 번 재시도)
+        
+        글 저장 이후에 호출해야 새 버전으로 이전 목록이 캐시되지 않는다.
+        카운터 갱신 실패로 이미 끝난 쓰기를 실패 처리하지 않도록 오류는 로그만 남기고,
+        다음 목록 조회에서 304를 보내지 않도록 실패 상태를 기록한다.
+        """
+        for attempt in range(2):
+            try:
+                await self.meta_collection.update_one(
+                    {"_id": self.posts_collection_name},
+                    {"$inc": {"version": 1}},
+                    upsert=True
+                )
+                self._posts_version_stale = False
+                return True
+            except Exception as e:
+                logger.warning(f"posts 컬렉션 버전 갱신 실패 ({attempt + 1}/2): {e}")
+        self._posts_version_stale = True
+        return False
+    
+    async def get_database_info(self) -> dict:
+        """데이터베이스 정보 반환"""
+        try:
+            if self.db is None:
+                return {"error": "데이터베이스에 연결되지 않음"}
+            
+            if self.posts_collection is None:
+                return {"error": "컬렉션이 초기화되지 않음"}
+            
+            # 컬렉션 통계
+            stats = await self.db.command("collStats", self.posts_collection_name)
+            
+            return {
+                "database_name": self.database_name,
+                "collection_name": self.posts_collection_name,
+                "document_count": stats.get("count", 0),
+                "storage_size": stats.get("storageSize", 0),
+                "indexes": await self.posts_collection.list_indexes().to_list(length=None)
+            }
+        except Exception as e:
+            return {"error": f"데이터베이스 정보 조회 실패: {e}"}
+
 # 전역 MongoDB 인스턴스
 mongodb_client = MongoDB()
+async_mongodb_client = AsyncMongoDB()
 
 def get_mongodb():
     """MongoDB 클라이언트 반환"""
     return mongodb_client
 
+def get_async_mongodb():
+    """비동기 MongoDB 클라이언트 반환"""
+    return async_mongodb_client
+
 def init_mongodb():
     """MongoDB 초기화"""
     success = mongodb_client.connect()
@@ -160,4 +424,17 @@ def init_mongodb():
         logger.info("MongoDB 초기화 완료")
     else:
         logger.error("MongoDB 초기화 실패")
-    return success 
\ No newline at end of file
+    return success
+
+async def init_async_mongodb():
+    """비동기 MongoDB 초기화"""
+    success = await async_mongodb_client.connect()
+    if success:
+        logger.info("MongoDB(async) 초기화 완료")
+    else:
+        logger.error("MongoDB(async) 초기화 실패")
+    return success
+
+def close_async_mongodb():
+    """비동기 MongoDB 연결 해제 (애플리케이션 종료 시)"""
+    async_mongodb_client.disconnect()
@@ -3,11 +3,23 @@ from typing import Optional, List
 from datetime import datetime
 from enum import Enum
 
+from backend.post.utils.date_range import to_naive_local
+
 class PostStatus(str, Enum):
     """글 상태 열거형"""
     PUBLISHED = "published"
     DELETED = "deleted"
 
+class ImageDerivative(BaseModel):
+    """썸네일/중간 크기 파생 이미지 정보 모델"""
+    name: str  # thumb, medium 등
+    filename: str
+    file_path: str
+    width: int
+    height: int
+    file_size: int
+    format: str
+
 class ImageInfo(BaseModel):
     """이미지 정보 모델"""
     filename: str
@@ -15,6 +27,7 @@ class ImageInfo(BaseModel):
     file_path: str
     file_size: int
     upload_date: datetime
+    derivatives: List[ImageDerivative] = []  # 글 저장 후 백그라운드에서 생성되어 채워짐
 
 class PostCreate(BaseModel):
     """글 작성 시 사용하는 모델"""
@@ -45,6 +58,16 @@ class PostCreate(BaseModel):
             raise ValueError('이미지는 최대 3장까지 업로드할 수 있습니다')
         return v
 
+class PostImport(PostCreate):
+    """글 일괄 작성/가져오기 항목 모델 (기존 시스템의 작성일시 유지 가능)"""
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    
+    @validator('created_at', 'updated_at')
+    def to_naive_local_time(cls, v):
+        # 저장된 글과 같은 기준(datetime.now()의 timezone 없는 로컬 시각)으로 맞춤
+        return to_naive_local(v)
+
 class PostUpdate(BaseModel):
     """글 수정 시 사용하는 모델"""
     title: Optional[str] = None
@@ -86,10 +109,50 @@ class PostListResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     images: List[ImageInfo] = []  # 이미지 정보 목록
+    excerpt: str = ""  # 본문 요약 (작성/수정 시 미리 계산)
+    word_count: int = 0
+    image_count: int = 0
     
     class Config:
         from_attributes = True
 
+class PostPageResponse(BaseModel):
+    """커서 기반 글 목록 페이지 응답 모델"""
+    items: List[PostListResponse] = []
+    limit: int
+    next_cursor: Optional[str] = None  # 다음 페이지 조회용 커서 (마지막 페이지면 None)
+
+class PostSearchHit(PostListResponse):
+    """검색 결과 항목 (관련도 점수 포함)"""
+    score: float
+
+class PostSearchResponse(BaseModel):
+    """글 검색 응답 모델"""
+    query: str
+    items: List[PostSearchHit] = []
+    limit: int
+    offset: int
+    next_offset: Optional[int] = None  # 다음 페이지 offset (마지막 페이지면 None)
+
+class PostRangeResponse(BaseModel):
+    """기간(일/주/월) 글 목록 응답 모델"""
+    period: str
+    start: datetime
+    end: datetime  # 미포함
+    items: List[PostListResponse] = []
+
+class PostDayCount(BaseModel):
+    """날짜별 글 수"""
+    date: str  # YYYY-MM-DD
+    count: int
+
+class PostCalendarResponse(BaseModel):
+    """월간 캘린더용 날짜별 글 수 응답 모델"""
+    year: int
+    month: int
+    total: int
+    days: List[PostDayCount] = []
+
 class PostDetailResponse(BaseModel):
     """글 상세 조회 응답 모델"""
     id: str
@@ -108,6 +171,19 @@ class PostCreateResponse(BaseModel):
     message: str
     post_id: str
 
+class PostBulkItemError(BaseModel):
+    """일괄 작성 항목별 오류"""
+    index: int  # 요청 본문에서의 항목 순번 (0부터)
+    error: str
+
+class PostBulkCreateResponse(BaseModel):
+    """글 일괄 작성 후 응답 모델"""
+    message: str
+    inserted_count: int
+    failed_count: int
+    post_ids: List[str] = []
+    errors: List[PostBulkItemError] = []
+
 class PostUpdateResponse(BaseModel):
     """글 수정 후 응답 모델"""
     message: str
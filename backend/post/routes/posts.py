@@ -1,33 +1,124 @@
-from fastapi import APIRouter, HTTPException, status, UploadFile, File
-from typing import List
-from datetime import datetime
+from fastapi import APIRouter, HTTPException, status, UploadFile, File, Query, Header, Response, Request, BackgroundTasks
+from fastapi.responses import StreamingResponse
+from pymongo import ReturnDocument
+from pymongo.errors import ConnectionFailure, BulkWriteError
+from typing import List, Optional, Union
+from datetime import date, datetime
 import uuid
+import json
 import os
+import logging
 
 from backend.post.models.post import (
     PostCreate, PostUpdate, PostListResponse, PostDetailResponse,
     PostCreateResponse, PostUpdateResponse, PostDeleteResponse, PostStatus,
-    ImageUploadResponse, ImageDeleteResponse, ImageInfo
+    ImageUploadResponse, ImageDeleteResponse, ImageInfo, PostPageResponse,
+    PostImport, PostBulkItemError, PostBulkCreateResponse,
+    PostRangeResponse, PostDayCount, PostCalendarResponse, PostSearchHit, PostSearchResponse
 )
-from backend.post.database.mongodb import get_mongodb
+from backend.post.database.mongodb import get_async_mongodb
+from backend.cache import post_cache
 from backend.post.utils.image_utils import image_utils
+from backend.post.utils.pagination import encode_cursor, decode_cursor, keyset_filter
+from backend.post.utils.etag import make_etag, make_list_etag, etag_matches, parse_etag, version_filter
+from backend.post.utils.date_range import month_bounds, period_bounds, to_naive_local
+from backend.post.utils.search import post_search
+from backend.post.utils.summary import build_summary
+from backend.post.utils.serialization import to_ndjson_line, to_csv_row, csv_header, dumps, document_to_model_dict
 
 router = APIRouter(prefix="/posts", tags=["posts"])
 
-# MongoDB 클라이언트 가져오기
-mongodb = get_mongodb()
+logger = logging.getLogger(__name__)
+
+# 목록 조회 설정
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+VISIBLE_STATUSES = [s.value for s in PostStatus if s != PostStatus.DELETED]  # 목록에 노출되는 상태
+
+# 조건부 조회 응답의 Cache-Control (no-cache: 저장은 하되 매번 ETag로 재검증)
+POST_CACHE_CONTROL = os.getenv("POST_CACHE_CONTROL", "private, no-cache")
+
+# 일괄 작성 설정
+DEFAULT_BULK_CHUNK_SIZE = 500
+MAX_BULK_CHUNK_SIZE = 5000
+
+# 검색 설정 (관련도 순 정렬이라 offset 방식이며, 깊은 페이지는 제한)
+MAX_SEARCH_OFFSET = 1000
+
+# 내보내기 설정 (커서 배치 크기 = 한 번에 메모리에 두는 글 수)
+EXPORT_BATCH_SIZE = 500
+
+# 목록 응답 모델에 있는 필드만 조회 (content 본문 대신 미리 계산한 요약 필드만 읽음)
+LIST_PROJECTION = {
+    "_id": 0,
+    "post_id": 1,
+    **{field: 1 for field in PostListResponse.model_fields if field != "id"}
+}
+
+# 비동기 MongoDB 클라이언트 가져오기
+mongodb = get_async_mongodb()
+
+def _move_post_images(temp_filenames: Optional[List[str]], post_id: str, current_time: datetime) -> list:
+    """임시 이미지들을 정식 업로드 폴더로 옮기고 글 문서에 저장할 이미지 정보 목록 반환"""
+    images_info = []
+    if not temp_filenames:
+        return images_info
+    
+    for temp_filename in temp_filenames:
+        try:
+            # 임시 파일을 정식 업로드 폴더로 이동
+            permanent_filename = image_utils.move_temp_to_permanent(temp_filename, post_id)
+            
+            # 이미지 정보 저장
+            file_info = image_utils.get_file_info(permanent_filename)
+            images_info.append({
+                "filename": permanent_filename,
+                "original_filename": temp_filename,
+                "file_path": os.path.join("uploads/images", permanent_filename),
+                "file_size": file_info["file_size"] if file_info else 0,
+                "upload_date": current_time
+            })
+        except HTTPException:
+            # 임시 파일 이동 실패 시 다른 임시 파일들 정리
+            for temp_file in temp_filenames:
+                image_utils.delete_temp_file(temp_file)
+            raise
+    
+    return images_info
+
+async def _attach_image_derivatives(post_id: str, filenames: List[str]):
+    """글 이미지의 파생 이미지를 생성해 images 항목에 기록 (응답 후 백그라운드 작업)"""
+    collection = mongodb.get_posts_collection()
+    updated = False
+    for filename in filenames:
+        try:
+            derivatives = await image_utils.create_derivatives(filename)
+            if not derivatives:
+                continue
+            result = await collection.update_one(
+                {"post_id": post_id, "images.filename": filename},
+                {"$set": {"images.$.derivatives": derivatives}, "$inc": {"rev": 1}}
+            )
+            updated = updated or result.modified_count > 0
+        except Exception as e:
+            # 파생 이미지는 부가 기능이므로 실패해도 원본 이미지는 그대로 제공
+            logger.warning(f"파생 이미지 생성 실패 ({post_id}, {filename}): {e}")
+    
+    if updated:
+        # updated_at은 사용자 수정 시각이므로 유지 (상세 ETag는 rev 증가로 바뀜), 캐시/목록 버전 갱신
+        await post_cache.delete(post_id)
+        await mongodb.bump_posts_version()
 
 @router.post("/", response_model=PostCreateResponse, status_code=status.HTTP_201_CREATED)
-async def create_post(post_data: PostCreate):
-    """글 작성"""
+async def create_post(post_data: PostCreate, background_tasks: BackgroundTasks):
+    """글 작성 (이미지 썸네일/중간 크기는 응답 후 백그라운드에서 생성)"""
     try:
-        # MongoDB 연결 확인
-        if not mongodb.check_connection():
-            if not mongodb.connect():
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail="데이터베이스 연결에 실패했습니다"
-                )
+        # MongoDB 연결 확인 (heartbeat 기반 상태, 장애 시에만 재연결)
+        if not await mongodb.ensure_connection():
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="데이터베이스 연결에 실패했습니다"
+            )
         
         collection = mongodb.get_posts_collection()
         if collection is None:
@@ -43,27 +134,7 @@ async def create_post(post_data: PostCreate):
         current_time = datetime.now()
         
         # 이미지 처리
-        images_info = []
-        if post_data.images:
-            for temp_filename in post_data.images:
-                try:
-                    # 임시 파일을 정식 업로드 폴더로 이동
-                    permanent_filename = image_utils.move_temp_to_permanent(temp_filename, post_id)
-                    
-                    # 이미지 정보 저장
-                    file_info = image_utils.get_file_info(permanent_filename)
-                    images_info.append({
-                        "filename": permanent_filename,
-                        "original_filename": temp_filename,
-                        "file_path": os.path.join("uploads/images", permanent_filename),
-                        "file_size": file_info["file_size"] if file_info else 0,
-                        "upload_date": current_time
-                    })
-                except HTTPException:
-                    # 임시 파일 이동 실패 시 다른 임시 파일들 정리
-                    for temp_file in post_data.images:
-                        image_utils.delete_temp_file(temp_file)
-                    raise
+        images_info = _move_post_images(post_data.images, post_id, current_time)
         
         # 글 데이터 저장
         new_post = {
@@ -78,7 +149,7 @@ async def create_post(post_data: PostCreate):
         
         # MongoDB 문서 생성 및 저장
         document = mongodb.create_post_document(new_post)
-        result = collection.insert_one(document)
+        result = await collection.insert_one(document)
         
         if not result.inserted_id:
             # 저장 실패 시 업로드된 이미지들 삭제
@@ -89,6 +160,12 @@ async def create_post(post_data: PostCreate):
                 detail="글 저장에 실패했습니다"
             )
         
+        post_search.index_post(post_id, document)
+        await mongodb.bump_posts_version()
+        
+        if images_info:
+            background_tasks.add_task(_attach_image_derivatives, post_id, [img["filename"] for img in images_info])
+        
         return PostCreateResponse(
             message="글이 성공적으로 작성되었습니다",
             post_id=post_id
@@ -96,23 +173,226 @@ async def create_post(post_data: PostCreate):
         
     except HTTPException:
         raise
+    except ConnectionFailure as e:
+        mongodb.report_failure(e)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="데이터베이스 연결에 실패했습니다"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"글 작성 중 오류가 발생했습니다: {str(e)}"
         )
 
-@router.get("/", response_model=List[PostListResponse])
-async def get_posts():
-    """글 목록 조회"""
+async def _iter_bulk_items(request: Request):
+    """요청 본문에서 (순번, 원본 항목) 순회 (NDJSON은 스트리밍으로 한 줄씩 파싱)"""
+    content_type = request.headers.get("content-type", "")
+    
+    if "ndjson" in content_type or "jsonlines" in content_type:
+        index = 0
+        buffer = b""
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield index, line
+                    index += 1
+        if buffer.strip():
+            yield index, buffer
+        return
+    
     try:
-        # MongoDB 연결 확인
-        if not mongodb.check_connection():
-            if not mongodb.connect():
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail="데이터베이스 연결에 실패했습니다"
+        items = await request.json()
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="요청 본문이 올바른 JSON이 아닙니다"
+        )
+    if not isinstance(items, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="요청 본문은 글 목록(JSON 배열)이어야 합니다"
+        )
+    for index, item in enumerate(items):
+        yield index, item
+
+async def _insert_bulk_chunk(collection, chunk: list, errors: list, background_tasks: BackgroundTasks) -> List[str]:
+    """(순번, 문서) 묶음을 순서 없는 insert_many로 저장하고 저장된 post_id 목록 반환"""
+    documents = [document for _, document in chunk]
+    failed_positions = set()
+    try:
+        await collection.insert_many(documents, ordered=False)
+    except BulkWriteError as e:
+        for write_error in e.details.get("writeErrors", []):
+            position = write_error["index"]
+            failed_positions.add(position)
+            errors.append(PostBulkItemError(index=chunk[position][0], error=write_error.get("errmsg", "저장 실패")))
+    
+    inserted_ids = []
+    for position, (_, document) in enumerate(chunk):
+        if position in failed_positions:
+            # 저장 실패한 글의 이미지 정리
+            for img_info in document["images"]:
+                image_utils.delete_permanent_file(img_info["filename"])
+        else:
+            post_search.index_post(document["post_id"], document)
+            inserted_ids.append(document["post_id"])
+            if document["images"]:
+                background_tasks.add_task(
+                    _attach_image_derivatives, document["post_id"], [img["filename"] for img in document["images"]]
                 )
+    return inserted_ids
+
+@router.post("/bulk", response_model=PostBulkCreateResponse)
+async def bulk_create_posts(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    chunk_size: int = Query(DEFAULT_BULK_CHUNK_SIZE, ge=1, le=MAX_BULK_CHUNK_SIZE, description="insert_many 한 번에 저장할 글 수")
+):
+    """글 일괄 작성/가져오기
+    
+    JSON 배열 또는 NDJSON(Content-Type: application/x-ndjson) 본문을 받아
+    chunk_size 단위의 순서 없는 insert_many로 저장하고, 항목별 오류를 보고한다.
+    """
+    try:
+        # MongoDB 연결 확인 (heartbeat 기반 상태, 장애 시에만 재연결)
+        if not await mongodb.ensure_connection():
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="데이터베이스 연결에 실패했습니다"
+            )
+        
+        collection = mongodb.get_posts_collection()
+        
+        errors: List[PostBulkItemError] = []
+        post_ids: List[str] = []
+        chunk = []
+        
+        async for index, raw_item in _iter_bulk_items(request):
+            try:
+                item = json.loads(raw_item) if isinstance(raw_item, bytes) else raw_item
+                post_data = PostImport(**item)
+            except (ValueError, TypeError) as e:
+                # JSON 파싱 오류 및 모델 검증 오류 (ValidationError는 ValueError 하위 클래스)
+                errors.append(PostBulkItemError(index=index, error=str(e)))
+                continue
+            
+            post_id = str(uuid.uuid4())
+            current_time = datetime.now()
+            try:
+                images_info = _move_post_images(post_data.images, post_id, current_time)
+            except HTTPException as e:
+                errors.append(PostBulkItemError(index=index, error=str(e.detail)))
+                continue
+            
+            created_at = post_data.created_at or current_time
+            document = mongodb.create_post_document({
+                "id": post_id,
+                "title": post_data.title,
+                "content": post_data.content,
+                "status": post_data.status,
+                "images": images_info,
+                "created_at": created_at,
+                "updated_at": post_data.updated_at or created_at
+            })
+            chunk.append((index, document))
+            
+            if len(chunk) >= chunk_size:
+                post_ids.extend(await _insert_bulk_chunk(collection, chunk, errors, background_tasks))
+                chunk = []
+        
+        if chunk:
+            post_ids.extend(await _insert_bulk_chunk(collection, chunk, errors, background_tasks))
+        
+        if post_ids:
+            await mongodb.bump_posts_version()
+        
+        errors.sort(key=lambda error: error.index)
+        return PostBulkCreateResponse(
+            message=f"{len(post_ids)}개의 글이 저장되었습니다",
+            inserted_count=len(post_ids),
+            failed_count=len(errors),
+            post_ids=post_ids,
+            errors=errors
+        )
+        
+    except HTTPException:
+        raise
+    except ConnectionFailure as e:
+        mongodb.report_failure(e)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="데이터베이스 연결에 실패했습니다"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"글 일괄 작성 중 오류가 발생했습니다: {str(e)}"
+        )
+
+def _build_post_list_item(doc: dict) -> PostListResponse:
+    """LIST_PROJECTION으로 조회한 문서를 목록 응답 항목으로 변환"""
+    # 이미지 정보 변환
+    images = []
+    for img_data in doc.get("images", []):
+        images.append(ImageInfo(
+            filename=img_data["filename"],
+            original_filename=img_data["original_filename"],
+            file_path=img_data["file_path"],
+            file_size=img_data["file_size"],
+            upload_date=img_data["upload_date"],
+            derivatives=img_data.get("derivatives", [])
+        ))
+    
+    return PostListResponse(
+        id=doc["post_id"],
+        title=doc["title"],
+        status=doc["status"],
+        created_at=doc["created_at"],
+        updated_at=doc["updated_at"],
+        images=images,
+        excerpt=doc.get("excerpt", ""),
+        word_count=doc.get("word_count", 0),
+        image_count=doc.get("image_count", 0)
+    )
+
+def _post_list_item_dict(doc: dict) -> dict:
+    """LIST_PROJECTION으로 조회한 문서를 PostListResponse와 같은 모양의 dict로 변환 (빠른 경로)"""
+    return document_to_model_dict(PostListResponse, doc, rename={"id": "post_id"})
+
+def _json_response(content, response: Response) -> Response:
+    """dict/list를 바로 JSON bytes 응답으로 반환 (response_model 검증/jsonable_encoder 생략)
+    
+    응답 모양은 response_model과 같으며, 라우트에 설정한 헤더(ETag 등)를 그대로 옮긴다.
+    """
+    return Response(content=dumps(content), media_type="application/json", headers=dict(response.headers))
+
+@router.get("/", response_model=Union[PostPageResponse, List[PostListResponse]])
+async def get_posts(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (지정 시 커서 기반 페이지네이션)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (변경 없으면 304)")
+):
+    """글 목록 조회
+    
+    limit 또는 cursor를 지정하면 (created_at, post_id) 기준 커서 기반 페이지로 응답하고,
+    지정하지 않으면 기존처럼 전체 목록을 반환한다.
+    ETag는 글이 바뀔 때마다 증가하는 컬렉션 버전이므로, 변경이 없으면 목록을 조회하지 않고 304로 응답한다.
+    """
+    paginated = limit is not None or cursor is not None
+    if paginated and limit is None:
+        limit = DEFAULT_PAGE_SIZE
+    
+    try:
+        # MongoDB 연결 확인 (heartbeat 기반 상태, 장애 시에만 재연결)
+        if not await mongodb.ensure_connection():
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="데이터베이스 연결에 실패했습니다"
+            )
         
         collection = mongodb.get_posts_collection()
         if collection is None:
@@ -121,36 +401,53 @@ async def get_posts():
                 detail="데이터베이스 컬렉션을 가져올 수 없습니다"
             )
         
+        # 컬렉션 버전이 같으면 목록 조회/직렬화 없이 304 (버전을 믿을 수 없으면 ETag 없이 응답)
+        version = await mongodb.get_posts_version()
+        if version is not None:
+            etag = make_list_etag(version)
+            if etag_matches(if_none_match, etag):
+                return _not_modified(etag)
+            response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = POST_CACHE_CONTROL
+        
         # 게시된 글만 조회 (삭제되지 않은 글)
-        query = {"status": {"$ne": PostStatus.DELETED}}
-        cursor = collection.find(query).sort("created_at", -1)
-        
-        posts = []
-        for doc in cursor:
-            # 이미지 정보 변환
-            images = []
-            for img_data in doc.get("images", []):
-                images.append(ImageInfo(
-                    filename=img_data["filename"],
-                    original_filename=img_data["original_filename"],
-                    file_path=img_data["file_path"],
-                    file_size=img_data["file_size"],
-                    upload_date=img_data["upload_date"]
-                ))
-            
-            posts.append(PostListResponse(
-                id=doc["post_id"],
-                title=doc["title"],
-                status=doc["status"],
-                created_at=doc["created_at"],
-                updated_at=doc["updated_at"],
-                images=images
-            ))
+        query = {"status": {"$in": VISIBLE_STATUSES}}
+        if cursor:
+            try:
+                last_created_at, last_post_id = decode_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                )
+            query.update(keyset_filter(last_created_at, last_post_id))
+        
+        db_cursor = collection.find(query, LIST_PROJECTION).sort([("created_at", -1), ("post_id", -1)])
+        if paginated:
+            # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+            db_cursor = db_cursor.limit(limit + 1)
+        
+        # 응답 모델 인스턴스를 만들지 않고 문서를 바로 JSON bytes로 직렬화
+        posts = [_post_list_item_dict(doc) async for doc in db_cursor]
         
-        return posts
+        if not paginated:
+            return _json_response(posts, response)
+        
+        next_cursor = None
+        if len(posts) > limit:
+            posts = posts[:limit]
+            next_cursor = encode_cursor(posts[-1]["created_at"], posts[-1]["id"])
+        
+        return _json_response({"items": posts, "limit": limit, "next_cursor": next_cursor}, response)
         
     except HTTPException:
         raise
+    except ConnectionFailure as e:
+        mongodb.report_failure(e)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="데이터베이스 연결에 실패했습니다"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -159,50 +456,328 @@ async def get_posts():
 
 
 
-@router.put("/{post_id}", response_model=PostUpdateResponse)
-async def update_post(post_id: str, post_data: PostUpdate):
-    """글 수정"""
+@router.get("/search", response_model=PostSearchResponse)
+async def search_posts(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (제목/본문)"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기"),
+    offset: int = Query(0, ge=0, le=MAX_SEARCH_OFFSET, description="건너뛸 결과 수"),
+    post_status: Optional[PostStatus] = Query(None, alias="status", description="글 상태 (미지정 시 삭제되지 않은 글)")
+):
+    """글 전체 텍스트 검색 (관련도 순, 같은 점수는 최신순)"""
     try:
-        # MongoDB 연결 확인
-        if not mongodb.check_connection():
-            if not mongodb.connect():
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail="데이터베이스 연결에 실패했습니다"
-                )
+        # MongoDB 연결 확인 (heartbeat 기반 상태, 장애 시에만 재연결)
+        if not await mongodb.ensure_connection():
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="데이터베이스 연결에 실패했습니다"
+            )
+        
+        collection = mongodb.get_posts_collection()
+        statuses = [post_status.value] if post_status else VISIBLE_STATUSES
+        
+        # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+        results = await post_search.search(collection, q, statuses, LIST_PROJECTION, offset, limit + 1)
+        next_offset = offset + limit if len(results) > limit else None
+        
+        items = [
+            PostSearchHit(**_build_post_list_item(doc).dict(), score=round(score, 4))
+            for doc, score in results[:limit]
+        ]
+        return PostSearchResponse(query=q, items=items, limit=limit, offset=offset, next_offset=next_offset)
+        
+    except HTTPException:
+        raise
+    except ConnectionFailure as e:
+        mongodb.report_failure(e)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="데이터베이스 연결에 실패했습니다"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"글 검색 중 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.get("/range", response_model=PostRangeResponse)
+async def get_posts_by_period(
+    day: date = Query(..., alias="date", description="기준 날짜 (YYYY-MM-DD)"),
+    period: str = Query("day", pattern="^(day|week|month)$", description="기간 단위 (day | week | month, 주는 월요일 시작)")
+):
+    """기준 날짜가 속한 일/주/월의 글 목록 조회 (created_at 인덱스 범위 조회)"""
+    try:
+        try:
+            start, end = period_bounds(day, period)
+        except (ValueError, OverflowError):
+            # 9999-12-31이 속한 주/월처럼 datetime 범위를 넘는 구간
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="조회할 수 없는 날짜 범위입니다"
+            )
+        
+        # MongoDB 연결 확인 (heartbeat 기반 상태, 장애 시에만 재연결)
+        if not await mongodb.ensure_connection():
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="데이터베이스 연결에 실패했습니다"
+            )
         
         collection = mongodb.get_posts_collection()
+        query = {
+            "status": {"$in": VISIBLE_STATUSES},
+            "created_at": {"$gte": start, "$lt": end}
+        }
+        db_cursor = collection.find(query, LIST_PROJECTION).sort([("created_at", -1), ("post_id", -1)])
+        items = [_build_post_list_item(doc) async for doc in db_cursor]
         
-        # 글 존재 여부 확인
-        existing_post = collection.find_one({"post_id": post_id})
-        if not existing_post:
+        return PostRangeResponse(period=period, start=start, end=end, items=items)
+        
+    except HTTPException:
+        raise
+    except ConnectionFailure as e:
+        mongodb.report_failure(e)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="데이터베이스 연결에 실패했습니다"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"기간별 글 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.get("/calendar", response_model=PostCalendarResponse)
+async def get_post_calendar(
+    year: int = Query(..., ge=1970, le=9999, description="연도"),
+    month: int = Query(..., ge=1, le=12, description="월")
+):
+    """월간 캘린더용 날짜별 글 수 조회 ($group 집계 한 번으로 계산)"""
+    try:
+        try:
+            start, end = month_bounds(year, month)
+        except (ValueError, OverflowError):
+            # 9999-12-31이 속한 주/월처럼 datetime 범위를 넘는 구간
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="해당 글을 찾을 수 없습니다"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="조회할 수 없는 날짜 범위입니다"
             )
         
-        # 삭제된 글은 수정 불가
-        if existing_post["status"] == PostStatus.DELETED:
+        # MongoDB 연결 확인 (heartbeat 기반 상태, 장애 시에만 재연결)
+        if not await mongodb.ensure_connection():
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="해당 글을 찾을 수 없습니다"
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="데이터베이스 연결에 실패했습니다"
+            )
+        
+        collection = mongodb.get_posts_collection()
+        # created_at은 naive datetime 그대로 저장되므로 UTC 기준 날짜 문자열이 저장 시각의 날짜와 같음
+        pipeline = [
+            {"$match": {
+                "status": {"$in": VISIBLE_STATUSES},
+                "created_at": {"$gte": start, "$lt": end}
+            }},
+            {"$group": {
+                "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}},
+                "count": {"$sum": 1}
+            }},
+            {"$sort": {"_id": 1}}
+        ]
+        days = [
+            PostDayCount(date=doc["_id"], count=doc["count"])
+            async for doc in collection.aggregate(pipeline)
+        ]
+        
+        return PostCalendarResponse(
+            year=year,
+            month=month,
+            total=sum(day_count.count for day_count in days),
+            days=days
+        )
+        
+    except HTTPException:
+        raise
+    except ConnectionFailure as e:
+        mongodb.report_failure(e)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="데이터베이스 연결에 실패했습니다"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"캘린더 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.get("/export")
+async def export_posts(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="내보내기 형식"),
+    start: Optional[datetime] = Query(None, description="작성일시 시작 (포함)"),
+    end: Optional[datetime] = Query(None, description="작성일시 끝 (미포함)"),
+    post_status: Optional[PostStatus] = Query(None, alias="status", description="글 상태 (미지정 시 삭제되지 않은 글)")
+):
+    """글 내보내기 (MongoDB 커서에서 배치 단위로 바로 스트리밍)"""
+    # MongoDB 연결 확인 (heartbeat 기반 상태, 장애 시에만 재연결)
+    if not await mongodb.ensure_connection():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="데이터베이스 연결에 실패했습니다"
+        )
+    
+    collection = mongodb.get_posts_collection()
+    
+    query = {"status": post_status.value if post_status else {"$in": VISIBLE_STATUSES}}
+    # created_at은 timezone 없는 로컬 시각으로 저장되므로 ?start=...+09:00 같은 값은 같은 기준으로 변환
+    created_at_range = {}
+    if start:
+        created_at_range["$gte"] = to_naive_local(start)
+    if end:
+        created_at_range["$lt"] = to_naive_local(end)
+    if created_at_range:
+        query["created_at"] = created_at_range
+    
+    db_cursor = collection.find(query, {"_id": 0}).sort("created_at", 1).batch_size(EXPORT_BATCH_SIZE)
+    to_line = to_ndjson_line if format == "ndjson" else to_csv_row
+    
+    async def generate():
+        try:
+            if format == "csv":
+                yield csv_header()
+            # 한 배치 분량만 모아서 내보냄
+            lines = []
+            async for doc in db_cursor:
+                lines.append(to_line(doc))
+                if len(lines) >= EXPORT_BATCH_SIZE:
+                    yield "".join(lines)
+                    lines = []
+            if lines:
+                yield "".join(lines)
+        except ConnectionFailure as e:
+            mongodb.report_failure(e)
+            raise
+        finally:
+            await db_cursor.close()
+    
+    media_type = "application/x-ndjson" if format == "ndjson" else "text/csv; charset=utf-8"
+    return StreamingResponse(
+        generate(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="posts-export.{format}"'}
+    )
+
+# 정적 경로는 /{post_id}보다 먼저 등록해야 글 ID로 해석되지 않음
+@router.get("/health", status_code=status.HTTP_200_OK)
+async def health_check():
+    """헬스 체크"""
+    try:
+        if not await mongodb.check_connection():
+            await mongodb.connect()
+        
+        collection = mongodb.get_posts_collection()
+        if collection is None:
+            return {
+                "status": "unhealthy", 
+                "database": "collection_error",
+                "error": "컬렉션을 가져올 수 없습니다"
+            }
+        
+        total_posts = await collection.count_documents({})
+        published_posts = await collection.count_documents({"status": PostStatus.PUBLISHED})
+        
+        return {
+            "status": "healthy", 
+            "database": "connected",
+            "total_posts": total_posts,
+            "published_posts": published_posts,
+            "connection": mongodb.health.get_status(),
+            "cache": post_cache.get_stats(),
+            "search": post_search.get_stats()
+        }
+    except Exception as e:
+        return {
+            "status": "unhealthy", 
+            "database": "disconnected",
+            "error": str(e),
+            "connection": mongodb.health.get_status()
+        } 
+
+def _editable_post_filter(post_id: str, if_match: Optional[str]) -> dict:
+    """수정/삭제 대상 조건 (삭제되지 않은 글 + If-Match 버전 일치)"""
+    post_filter = {"post_id": post_id, "status": {"$ne": PostStatus.DELETED}}
+    if if_match and if_match.strip() != "*":
+        version = parse_etag(if_match)
+        if version is None:
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="If-Match 헤더 형식이 올바르지 않습니다"
+            )
+        post_filter.update(version_filter(*version))
+    return post_filter
+
+async def _raise_not_found_or_conflict(collection, post_id: str, if_match: Optional[str]):
+    """조건부 수정이 아무 문서도 찾지 못한 경우 404와 412를 구분"""
+    if if_match:
+        exists = await collection.find_one(
+            {"post_id": post_id, "status": {"$ne": PostStatus.DELETED}},
+            {"_id": 1}
+        )
+        if exists:
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="다른 곳에서 글이 먼저 수정되었습니다. 최신 글을 다시 조회해주세요"
+            )
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="해당 글을 찾을 수 없습니다"
+    )
+
+@router.put("/{post_id}", response_model=PostUpdateResponse)
+async def update_post(
+    post_id: str,
+    post_data: PostUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None, description="글 조회 시 받은 ETag (낙관적 동시성 제어)")
+):
+    """글 수정 (조건부 find_one_and_update 한 번으로 처리)"""
+    try:
+        # MongoDB 연결 확인 (heartbeat 기반 상태, 장애 시에만 재연결)
+        if not await mongodb.ensure_connection():
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="데이터베이스 연결에 실패했습니다"
             )
         
+        collection = mongodb.get_posts_collection()
+        post_filter = _editable_post_filter(post_id, if_match)
+        
         # 변경된 필드만 업데이트
         update_data = post_data.dict(exclude_unset=True)
-        if update_data:
+        if not update_data:
+            # 변경 사항이 없으면 존재 여부(및 버전)만 확인
+            existing_post = await collection.find_one(post_filter, {"_id": 0, "updated_at": 1, "rev": 1})
+            if not existing_post:
+                await _raise_not_found_or_conflict(collection, post_id, if_match)
+        else:
             update_data["updated_at"] = datetime.now()
+            # 본문/이미지가 바뀌면 요약 필드도 함께 갱신
+            update_data.update(build_summary(update_data))
             
-            result = collection.update_one(
-                {"post_id": post_id},
-                {"$set": update_data}
+            # 삭제되지 않았고 버전이 일치하는 경우에만 수정
+            # (updated_at은 밀리초 단위라 같은 밀리초의 수정도 구분되도록 rev도 증가)
+            existing_post = await collection.find_one_and_update(
+                post_filter,
+                {"$set": update_data, "$inc": {"rev": 1}},
+                projection={"updated_at": 1, "rev": 1},
+                return_document=ReturnDocument.AFTER
             )
+            if not existing_post:
+                await _raise_not_found_or_conflict(collection, post_id, if_match)
             
-            if result.modified_count == 0:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="글 수정에 실패했습니다"
-                )
+            # 상세 조회 캐시 무효화 및 검색 색인 갱신
+            await post_cache.delete(post_id)
+            post_search.index_post(post_id, update_data)
+            await mongodb.bump_posts_version()
+        
+        response.headers["ETag"] = make_etag(existing_post["updated_at"], existing_post.get("rev", 0))
         
         return PostUpdateResponse(
             message="글이 성공적으로 수정되었습니다",
@@ -211,6 +786,12 @@ async def update_post(post_id: str, post_data: PostUpdate):
         
     except HTTPException:
         raise
+    except ConnectionFailure as e:
+        mongodb.report_failure(e)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="데이터베이스 연결에 실패했습니다"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -218,48 +799,37 @@ async def update_post(post_id: str, post_data: PostUpdate):
         )
 
 @router.delete("/{post_id}", response_model=PostDeleteResponse)
-async def delete_post(post_id: str):
+async def delete_post(
+    post_id: str,
+    if_match: Optional[str] = Header(None, description="글 조회 시 받은 ETag (낙관적 동시성 제어)")
+):
     """글 삭제"""
     try:
-        # MongoDB 연결 확인
-        if not mongodb.check_connection():
-            if not mongodb.connect():
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail="데이터베이스 연결에 실패했습니다"
-                )
-        
-        collection = mongodb.get_posts_collection()
-        
-        # 글 존재 여부 확인
-        existing_post = collection.find_one({"post_id": post_id})
-        if not existing_post:
+        # MongoDB 연결 확인 (heartbeat 기반 상태, 장애 시에만 재연결)
+        if not await mongodb.ensure_connection():
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="해당 글을 찾을 수 없습니다"
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="데이터베이스 연결에 실패했습니다"
             )
         
-        # 이미 삭제된 글인지 확인
-        if existing_post["status"] == PostStatus.DELETED:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="해당 글을 찾을 수 없습니다"
-            )
+        collection = mongodb.get_posts_collection()
         
-        # 소프트 삭제 (상태만 변경)
-        result = collection.update_one(
-            {"post_id": post_id},
+        # 소프트 삭제 (삭제되지 않았고 버전이 일치하는 경우에만 상태 변경)
+        deleted_post = await collection.find_one_and_update(
+            _editable_post_filter(post_id, if_match),
             {"$set": {
                 "status": PostStatus.DELETED,
                 "updated_at": datetime.now()
-            }}
+            }, "$inc": {"rev": 1}},
+            projection={"_id": 1}
         )
+        if not deleted_post:
+            await _raise_not_found_or_conflict(collection, post_id, if_match)
         
-        if result.modified_count == 0:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="글 삭제에 실패했습니다"
-            )
+        # 상세 조회 캐시 무효화 및 검색 색인 갱신
+        await post_cache.delete(post_id)
+        post_search.index_post(post_id, {"status": PostStatus.DELETED})
+        await mongodb.bump_posts_version()
         
         return PostDeleteResponse(
             message="글이 성공적으로 삭제되었습니다",
@@ -268,6 +838,12 @@ async def delete_post(post_id: str):
         
     except HTTPException:
         raise
+    except ConnectionFailure as e:
+        mongodb.report_failure(e)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="데이터베이스 연결에 실패했습니다"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -312,27 +888,51 @@ async def delete_temp_image(filename: str):
             detail=f"이미지 삭제 중 오류가 발생했습니다: {str(e)}"
         )
 
+def _not_modified(etag: str) -> Response:
+    """본문 없는 304 응답 (ETag/Cache-Control은 200 응답과 동일하게 유지)"""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": POST_CACHE_CONTROL}
+    )
+
+def _post_detail_response(post_doc: dict, response: Response, if_none_match: Optional[str]):
+    """ETag가 일치하면 직렬화 없이 304, 아니면 상세 응답 생성"""
+    etag = make_etag(post_doc["updated_at"], post_doc.get("rev", 0))
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = POST_CACHE_CONTROL
+    return _json_response(document_to_model_dict(PostDetailResponse, post_doc, rename={"id": "post_id"}), response)
+
 @router.get("/{post_id}", response_model=PostDetailResponse)
-async def get_post_detail(post_id: str):
-    """글 상세 조회"""
+async def get_post_detail(
+    post_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (변경 없으면 304)")
+):
+    """글 상세 조회 (If-None-Match가 현재 ETag와 같으면 본문 없이 304)"""
     try:
-        # MongoDB 연결 확인
-        if not mongodb.check_connection():
-            if not mongodb.connect():
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail="데이터베이스 연결에 실패했습니다"
-                )
+        # 캐시에 있으면 DB 조회 없이 반환
+        post_doc = await post_cache.get(post_id)
+        if post_doc is not None:
+            return _post_detail_response(post_doc, response, if_none_match)
+        
+        # MongoDB 연결 확인 (heartbeat 기반 상태, 장애 시에만 재연결)
+        if not await mongodb.ensure_connection():
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="데이터베이스 연결에 실패했습니다"
+            )
         
         collection = mongodb.get_posts_collection()
-        if not collection:
+        if collection is None:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="데이터베이스 컬렉션을 가져올 수 없습니다"
             )
         
         # 글 조회
-        post_doc = collection.find_one({"post_id": post_id})
+        post_doc = await collection.find_one({"post_id": post_id}, {"_id": 0})
         if not post_doc:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -346,62 +946,20 @@ async def get_post_detail(post_id: str):
                 detail="해당 글을 찾을 수 없습니다"
             )
         
-        # 이미지 정보 변환
-        images = []
-        for img_data in post_doc.get("images", []):
-            images.append(ImageInfo(
-                filename=img_data["filename"],
-                original_filename=img_data["original_filename"],
-                file_path=img_data["file_path"],
-                file_size=img_data["file_size"],
-                upload_date=img_data["upload_date"]
-            ))
-        
-        return PostDetailResponse(
-            id=post_doc["post_id"],
-            title=post_doc["title"],
-            content=post_doc["content"],
-            status=post_doc["status"],
-            created_at=post_doc["created_at"],
-            updated_at=post_doc["updated_at"],
-            images=images
-        )
+        await post_cache.set(post_id, post_doc)
+        
+        return _post_detail_response(post_doc, response, if_none_match)
         
     except HTTPException:
         raise
+    except ConnectionFailure as e:
+        mongodb.report_failure(e)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="데이터베이스 연결에 실패했습니다"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"글 조회 중 오류가 발생했습니다: {str(e)}"
         )
-
-@router.get("/health", status_code=status.HTTP_200_OK)
-async def health_check():
-    """헬스 체크"""
-    try:
-        if not mongodb.check_connection():
-            mongodb.connect()
-        
-        collection = mongodb.get_posts_collection()
-        if not collection:
-            return {
-                "status": "unhealthy", 
-                "database": "collection_error",
-                "error": "컬렉션을 가져올 수 없습니다"
-            }
-        
-        total_posts = collection.count_documents({})
-        published_posts = collection.count_documents({"status": PostStatus.PUBLISHED})
-        
-        return {
-            "status": "healthy", 
-            "database": "connected",
-            "total_posts": total_posts,
-            "published_posts": published_posts
-        }
-    except Exception as e:
-        return {
-            "status": "unhealthy", 
-            "database": "disconnected",
-            "error": str(e)
-        } 
\ No newline at end of file
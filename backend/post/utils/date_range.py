@@ -0,0 +1,26 @@
+from datetime import date, datetime, timedelta
+from typing import Optional, Tuple
+
+def to_naive_local(value: Optional[datetime]) -> Optional[datetime]:
+    """timezone이 있는 datetime을 저장 기준(datetime.now()의 timezone 없는 로컬 시각)으로 변환"""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone().replace(tzinfo=None)
+    return value
+
+def month_bounds(year: int, month: int) -> Tuple[datetime, datetime]:
+    """해당 월의 [시작, 다음 달 시작) 구간 반환"""
+    start = datetime(year, month, 1)
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return start, end
+
+def period_bounds(day: date, period: str) -> Tuple[datetime, datetime]:
+    """기준 날짜가 속한 일/주(월요일 시작)/월의 [시작, 끝) 구간 반환 (잘못된 단위는 ValueError)"""
+    if period == "day":
+        start = datetime(day.year, day.month, day.day)
+        return start, start + timedelta(days=1)
+    if period == "week":
+        start = datetime(day.year, day.month, day.day) - timedelta(days=day.weekday())
+        return start, start + timedelta(days=7)
+    if period == "month":
+        return month_bounds(day.year, day.month)
+    raise ValueError(f"지원하지 않는 기간 단위입니다: {period}")
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+# MongoDB는 datetime을 밀리초 단위로 저장하므로 버전도 밀리초 단위로 계산
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MS = timedelta(milliseconds=1)
+
+def version_from_datetime(updated_at: datetime) -> int:
+    """updated_at을 밀리초 정수 버전으로 변환 (저장 시 잘리는 정밀도와 동일)"""
+    return (updated_at.replace(tzinfo=None) - _EPOCH) // _ONE_MS
+
+def make_etag(updated_at: datetime, rev: int = 0) -> str:
+    """updated_at + rev 기반 강한(strong) ETag 생성
+
+    rev는 글 수정/삭제와 updated_at을 바꾸지 않는 시스템 갱신(파생 이미지 기록 등)마다 1씩 증가해
+    같은 밀리초 안의 수정도 서로 다른 ETag가 되며, rev가 없는(0인) 글은 기존과 같은 "<밀리초>" 형식을 유지한다.
+    """
+    version = version_from_datetime(updated_at)
+    return f'"{version}-{rev}"' if rev else f'"{version}"'
+
+def parse_etag(value: str) -> Optional[Tuple[int, int]]:
+    """ETag 헤더 값을 (버전, rev)로 변환 (형식이 맞지 않으면 None)"""
+    value = value.strip()
+    if value.startswith("W/"):
+        value = value[2:]
+    version, _, rev = value.strip('"').partition("-")
+    try:
+        return int(version), int(rev or 0)
+    except ValueError:
+        return None
+
+def version_filter(version: int, rev: int = 0) -> dict:
+    """updated_at이 해당 버전(밀리초)과 일치하고 rev가 같은 문서만 선택하는 조건"""
+    start = _EPOCH + version * _ONE_MS
+    return {
+        "updated_at": {"$gte": start, "$lt": start + _ONE_MS},
+        # rev 필드가 없는 기존 글은 rev 0으로 취급
+        "rev": rev if rev else {"$in": [None, 0]}
+    }
+
+def make_list_etag(version: int) -> str:
+    """컬렉션 버전 기반 목록 ETag 생성"""
+    return f'"list-{version}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교, 여러 값/* 지원)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == target:
+            return True
+    return False
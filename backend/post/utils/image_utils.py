@@ -1,18 +1,173 @@
 import os
+import json
 import uuid
 import shutil
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Optional
 from datetime import datetime
 from fastapi import UploadFile, HTTPException, status
+from starlette.concurrency import run_in_threadpool
 from pathlib import Path
-import aiofiles
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # Pillow가 없으면 썸네일/중간 크기 이미지 생성을 건너뜀
+    Image = None
+
+logger = logging.getLogger(__name__)
 
 # 설정값
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+FILE_TOO_LARGE_STATUS = 413  # Payload Too Large (Starlette 버전마다 상수 이름이 달라 숫자로 지정)
 ALLOWED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
 UPLOAD_DIR = "uploads/images"
 TEMP_DIR = "uploads/temp"
 
+# 업로드 저장 설정
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))  # 커널 복사를 못 쓸 때의 읽기/쓰기 단위 (1MB)
+MULTIPART_OVERHEAD = 64 * 1024  # multipart 경계/헤더 여유분 (Content-Length 조기 거부 기준)
+UPLOAD_PATH_SUFFIX = "/images/upload"
+
+# 파생 이미지(썸네일/중간 크기) 설정
+IMAGE_DERIVATIVES_ENABLED = os.getenv("IMAGE_DERIVATIVES_ENABLED", "true").lower() in ("1", "true", "yes")
+IMAGE_DERIVATIVE_SIZES = os.getenv("IMAGE_DERIVATIVE_SIZES", "thumb:320,medium:1024")  # 이름:긴 변 최대 픽셀
+IMAGE_DERIVATIVE_FORMAT = os.getenv("IMAGE_DERIVATIVE_FORMAT", "webp").lower()  # webp | jpeg
+IMAGE_DERIVATIVE_QUALITY = int(os.getenv("IMAGE_DERIVATIVE_QUALITY", "80"))
+IMAGE_DERIVATIVE_WORKERS = int(os.getenv("IMAGE_DERIVATIVE_WORKERS", "2"))
+
+def _parse_derivative_sizes(value: str) -> tuple:
+    """"thumb:320,medium:1024" 형식을 ((이름, 크기), ...)로 변환"""
+    sizes = []
+    for item in value.split(","):
+        name, _, size = item.strip().partition(":")
+        if name and size.isdigit():
+            sizes.append((name, int(size)))
+    return tuple(sizes)
+
+def _render_derivatives(source_path: str, sizes: tuple, image_format: str, quality: int) -> list:
+    """원본 이미지로 크기별 파생 이미지를 만들어 원본과 같은 폴더에 저장 (프로세스 풀에서 실행)"""
+    extension = "jpg" if image_format == "JPEG" else image_format.lower()
+    directory, source_filename = os.path.split(source_path)
+    stem = Path(source_filename).stem
+    
+    derivatives = []
+    with Image.open(source_path) as source:
+        # 애니메이션 GIF는 첫 프레임만 사용, EXIF 회전 정보 반영
+        image = ImageOps.exif_transpose(source)
+        if image_format == "JPEG":
+            if image.mode in ("RGBA", "LA", "P"):
+                # 투명 영역은 흰 배경으로 합성
+                rgba = image.convert("RGBA")
+                background = Image.new("RGB", rgba.size, (255, 255, 255))
+                background.paste(rgba, mask=rgba.getchannel("A"))
+                image = background
+            elif image.mode != "RGB":
+                image = image.convert("RGB")
+        elif image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+        
+        for name, max_size in sizes:
+            derived = image.copy()
+            derived.thumbnail((max_size, max_size), Image.LANCZOS)  # 원본보다 크게 키우지 않음
+            filename = f"{stem}_{name}.{extension}"
+            file_path = os.path.join(directory, filename)
+            derived.save(file_path, format=image_format, quality=quality, optimize=True)
+            derivatives.append({
+                "name": name,
+                "filename": filename,
+                "file_path": os.path.join(UPLOAD_DIR, filename),
+                "width": derived.width,
+                "height": derived.height,
+                "file_size": os.path.getsize(file_path),
+                "format": extension
+            })
+    return derivatives
+
+def _copy_fd(src_fd: int, dst_fd: int, size: int) -> int:
+    """파일 디스크립터 간 복사 (copy_file_range → sendfile → 청크 복사 순으로 시도)
+
+    copy_file_range/sendfile은 커널 안에서 복사하므로 유저 공간 버퍼를 거치지 않으며,
+    copy_file_range는 지원 파일시스템(btrfs, XFS 등)에서 데이터 블록을 공유(reflink)한다.
+    """
+    offset = 0
+    
+    def copy_file_range(count):
+        return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+    
+    def sendfile(count):
+        os.lseek(dst_fd, offset, os.SEEK_SET)
+        return os.sendfile(dst_fd, src_fd, offset, count)
+    
+    for copy in (copy_file_range, sendfile):
+        try:
+            while offset < size:
+                copied = copy(size - offset)
+                if copied == 0:
+                    break
+                offset += copied
+            return offset
+        except (AttributeError, OSError):
+            # 지원하지 않는 OS/파일시스템이면 다음 방식으로 이어서 복사
+            continue
+    
+    os.lseek(src_fd, offset, os.SEEK_SET)
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    while offset < size:
+        chunk = os.read(src_fd, min(UPLOAD_CHUNK_SIZE, size - offset))
+        if not chunk:
+            break
+        os.write(dst_fd, chunk)
+        offset += len(chunk)
+    return offset
+
+def _persist_upload(source, dest_path: str, size: int) -> int:
+    """업로드 임시 파일(SpooledTemporaryFile)을 dest_path에 저장 (스레드 풀에서 한 번에 실행)"""
+    source.seek(0)
+    try:
+        # SpooledTemporaryFile은 메모리에 있는 동안 name이 None (fileno()는 디스크로 강제 이동시키므로 사용하지 않음)
+        on_disk = source.name is not None
+    except AttributeError:
+        on_disk = False
+    if on_disk:
+        # 디스크로 넘어간 업로드는 커널 복사
+        with open(dest_path, "wb") as dest:
+            return _copy_fd(source.fileno(), dest.fileno(), size)
+    
+    # 메모리에 있는 작은 업로드(스풀 한도 이하)는 한 번에 기록
+    with open(dest_path, "wb") as dest:
+        return dest.write(source.read(size))
+
+class UploadSizeLimitMiddleware:
+    """이미지 업로드 요청을 Content-Length로 먼저 검사해 본문을 받기 전에 413으로 거부하는 ASGI 미들웨어"""
+    
+    def __init__(self, app, max_body_size: int = MAX_FILE_SIZE + MULTIPART_OVERHEAD):
+        self.app = app
+        self.max_body_size = max_body_size
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "POST" and scope["path"].endswith(UPLOAD_PATH_SUFFIX):
+            content_length = dict(scope["headers"]).get(b"content-length")
+            if content_length is not None and content_length.isdigit() and int(content_length) > self.max_body_size:
+                body = json.dumps({
+                    "detail": f"파일 크기가 너무 큽니다. 최대 {MAX_FILE_SIZE // (1024*1024)}MB까지 허용됩니다.",
+                    "status_code": FILE_TOO_LARGE_STATUS
+                }, ensure_ascii=False).encode("utf-8")
+                await send({
+                    "type": "http.response.start",
+                    "status": FILE_TOO_LARGE_STATUS,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode()),
+                        (b"connection", b"close")
+                    ]
+                })
+                await send({"type": "http.response.body", "body": body})
+                return
+        await self.app(scope, receive, send)
+
 class ImageUtils:
     """이미지 관련 유틸리티 클래스"""
     
@@ -20,6 +175,48 @@ class ImageUtils:
         # 업로드 디렉토리 생성
         os.makedirs(UPLOAD_DIR, exist_ok=True)
         os.makedirs(TEMP_DIR, exist_ok=True)
+        
+        # 파생 이미지 생성용 프로세스 풀 (첫 사용 시 생성)
+        self._derivative_executor: Optional[ProcessPoolExecutor] = None
+        self.derivative_sizes = _parse_derivative_sizes(IMAGE_DERIVATIVE_SIZES)
+        self.derivative_format = "WEBP" if IMAGE_DERIVATIVE_FORMAT == "webp" else "JPEG"
+        self.derivatives_enabled = IMAGE_DERIVATIVES_ENABLED and bool(self.derivative_sizes)
+        if self.derivatives_enabled and Image is None:
+            logger.warning("Pillow가 설치되지 않아 파생 이미지를 생성하지 않습니다")
+            self.derivatives_enabled = False
+        elif self.derivatives_enabled and self.derivative_format == "WEBP" and not features.check("webp"):
+            logger.warning("Pillow에 WebP 지원이 없어 파생 이미지를 JPEG로 생성합니다")
+            self.derivative_format = "JPEG"
+    
+    def _get_derivative_executor(self) -> ProcessPoolExecutor:
+        """프로세스 풀 반환 (스레드가 있는 프로세스에서 fork 하지 않도록 spawn 사용)"""
+        if self._derivative_executor is None:
+            self._derivative_executor = ProcessPoolExecutor(
+                max_workers=IMAGE_DERIVATIVE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._derivative_executor
+    
+    async def create_derivatives(self, filename: str) -> list:
+        """정식 업로드 이미지의 썸네일/중간 크기 이미지를 프로세스 풀에서 생성하고 정보 목록 반환"""
+        if not self.derivatives_enabled:
+            return []
+        source_path = os.path.abspath(os.path.join(UPLOAD_DIR, filename))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_derivative_executor(),
+            _render_derivatives,
+            source_path,
+            self.derivative_sizes,
+            self.derivative_format,
+            IMAGE_DERIVATIVE_QUALITY
+        )
+    
+    def shutdown(self):
+        """프로세스 풀 종료 (애플리케이션 종료 시)"""
+        if self._derivative_executor is not None:
+            self._derivative_executor.shutdown(wait=False, cancel_futures=True)
+            self._derivative_executor = None
     
     @staticmethod
     def validate_image_file(file: UploadFile) -> bool:
@@ -42,7 +239,7 @@ class ImageUtils:
         # 파일 크기 확인 (임시 파일로 읽어서 체크)
         if hasattr(file, 'size') and file.size and file.size > MAX_FILE_SIZE:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=FILE_TOO_LARGE_STATUS,
                 detail=f"파일 크기가 너무 큽니다. 최대 {MAX_FILE_SIZE // (1024*1024)}MB까지 허용됩니다."
             )
         
@@ -66,27 +263,25 @@ class ImageUtils:
         temp_filename = f"{uuid.uuid4()}{file_extension}"
         temp_file_path = os.path.join(TEMP_DIR, temp_filename)
         
-        # 파일 저장 및 크기 체크
-        file_size = 0
+        # 파일 크기 확인 (Starlette가 파싱하며 기록한 크기, 없으면 임시 파일 끝 위치)
+        file_size = file.size
+        if file_size is None:
+            file.file.seek(0, os.SEEK_END)
+            file_size = file.file.tell()
+        if file_size > MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=FILE_TOO_LARGE_STATUS,
+                detail=f"파일 크기가 너무 큽니다. 최대 {MAX_FILE_SIZE // (1024*1024)}MB까지 허용됩니다."
+            )
+        
+        # 파일 저장 (청크마다 스레드 풀을 오가지 않도록 저장 전체를 한 번에 실행)
         try:
-            async with aiofiles.open(temp_file_path, 'wb') as buffer:
-                while chunk := await file.read(1024):  # 1KB씩 읽기
-                    file_size += len(chunk)
-                    if file_size > MAX_FILE_SIZE:
-                        # 파일이 너무 크면 삭제하고 예외 발생
-                        await buffer.close()
-                        if os.path.exists(temp_file_path):
-                            os.remove(temp_file_path)
-                        raise HTTPException(
-                            status_code=status.HTTP_400_BAD_REQUEST,
-                            detail=f"파일 크기가 너무 큽니다. 최대 {MAX_FILE_SIZE // (1024*1024)}MB까지 허용됩니다."
-                        )
-                    await buffer.write(chunk)
+            written = await run_in_threadpool(_persist_upload, file.file, temp_file_path, file_size)
+            if written != file_size:
+                raise IOError(f"저장된 크기가 다릅니다 ({written}/{file_size} bytes)")
             
             return temp_filename, file_size
             
-        except HTTPException:
-            raise
         except Exception as e:
             # 에러 발생 시 임시 파일 삭제
             if os.path.exists(temp_file_path):
@@ -0,0 +1,27 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+def encode_cursor(created_at: datetime, post_id: str) -> str:
+    """마지막 글의 (created_at, post_id)를 불투명한 커서 문자열로 인코딩"""
+    payload = json.dumps({"c": created_at.isoformat(), "i": post_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """커서 문자열을 (created_at, post_id)로 디코딩 (잘못된 커서는 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(payload["c"]), str(payload["i"])
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {e}")
+
+def keyset_filter(created_at: datetime, post_id: str) -> dict:
+    """(created_at, post_id) 내림차순 기준으로 커서 이후의 문서만 조회하는 조건"""
+    return {
+        "$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "post_id": {"$lt": post_id}}
+        ]
+    }
@@ -0,0 +1,157 @@
+import os
+import re
+import math
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 검색 백엔드 설정
+POST_SEARCH_BACKEND = os.getenv("POST_SEARCH_BACKEND", "mongo").lower()  # mongo | memory
+
+# 필드별 가중치 (MongoDB 텍스트 인덱스 weights와 동일하게 유지)
+SEARCH_WEIGHTS = {"title": 3, "content": 1}
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+def tokenize(text: str) -> List[str]:
+    """소문자 단어 토큰 목록 (한글 포함, 형태소 분석/어간 추출 없음)"""
+    return _TOKEN_PATTERN.findall((text or "").lower())
+
+def _value(value):
+    """Enum 값을 문자열로 변환"""
+    return getattr(value, "value", value)
+
+class SearchBackend(ABC):
+    """글 검색 백엔드 공통 인터페이스"""
+
+    name = "base"
+
+    @abstractmethod
+    async def search(self, collection, text: str, statuses: list, projection: dict,
+                     offset: int, limit: int) -> List[Tuple[dict, float]]:
+        """관련도 순 (문서, 점수) 목록 반환"""
+
+    def index_post(self, post_id: str, fields: dict):
+        """글 작성/수정/삭제 시 색인 반영 (바뀐 필드만 넘겨도 됨)"""
+        pass
+
+    def get_stats(self) -> dict:
+        return {"backend": self.name}
+
+class MongoTextSearchBackend(SearchBackend):
+    """MongoDB 텍스트 인덱스(title_content_text) 기반 검색"""
+
+    name = "mongo"
+
+    async def search(self, collection, text, statuses, projection, offset, limit):
+        score = {"$meta": "textScore"}
+        db_cursor = collection.find(
+            {"$text": {"$search": text}, "status": {"$in": statuses}},
+            {**projection, "score": score}
+        ).sort([("score", score), ("created_at", -1)]).skip(offset).limit(limit)
+        return [(doc, doc.pop("score")) async for doc in db_cursor]
+
+class InMemorySearchBackend(SearchBackend):
+    """프로세스 내 역색인 검색 (텍스트 인덱스가 없는 테스트/단일 워커 환경용)
+
+    첫 검색 시 컬렉션 전체로 색인을 만들고, 이후에는 글 작성/수정/삭제 시 갱신한다.
+    (소프트 삭제된 글은 상태만 바뀌므로 색인에 남겨 두고 상태로 거른다)
+    점수는 필드 가중치를 곱한 TF-IDF 합이다.
+    """
+
+    name = "memory"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._built = False
+        self._postings = {}  # 토큰 -> {post_id: 가중 빈도}
+        self._docs = {}  # post_id -> {"tokens": {필드: Counter}, "status", "created_at"}
+
+    async def _ensure_built(self, collection):
+        """최초 검색 시 컬렉션 전체를 색인"""
+        if self._built:
+            return
+        projection = {"_id": 0, "post_id": 1, "status": 1, "created_at": 1, **{field: 1 for field in SEARCH_WEIGHTS}}
+        async for doc in collection.find({}, projection):
+            self._index(doc["post_id"], doc)
+        self._built = True
+        logger.info(f"검색 색인 생성 완료: {len(self._docs)}개 글")
+
+    def _index(self, post_id: str, fields: dict):
+        with self._lock:
+            entry = self._docs.setdefault(post_id, {"tokens": {}, "status": None, "created_at": None})
+            self._unpost(post_id, entry)
+            for field in SEARCH_WEIGHTS:
+                if field in fields:
+                    entry["tokens"][field] = Counter(tokenize(fields[field]))
+            for key in ("status", "created_at"):
+                if key in fields:
+                    entry[key] = _value(fields[key])
+            weighted = Counter()
+            for field, counts in entry["tokens"].items():
+                for token, count in counts.items():
+                    weighted[token] += count * SEARCH_WEIGHTS[field]
+            for token, weight in weighted.items():
+                self._postings.setdefault(token, {})[post_id] = weight
+
+    def _unpost(self, post_id: str, entry: dict):
+        """기존 토큰의 역색인 항목 제거 (lock 안에서 호출)"""
+        for counts in entry["tokens"].values():
+            for token in counts:
+                postings = self._postings.get(token)
+                if postings is not None:
+                    postings.pop(post_id, None)
+                    if not postings:
+                        del self._postings[token]
+
+    def index_post(self, post_id, fields):
+        # 색인 생성 전이면 첫 검색 때 컬렉션에서 읽어오므로 생략
+        if self._built:
+            self._index(post_id, fields)
+
+    async def search(self, collection, text, statuses, projection, offset, limit):
+        await self._ensure_built(collection)
+
+        scores = Counter()
+        with self._lock:
+            total = len(self._docs) or 1
+            for token in set(tokenize(text)):
+                postings = self._postings.get(token, {})
+                if not postings:
+                    continue
+                idf = math.log(1 + total / len(postings))
+                for post_id, weight in postings.items():
+                    scores[post_id] += weight * idf
+            ranked = [
+                (post_id, score) for post_id, score in scores.items()
+                if self._docs[post_id]["status"] in statuses
+            ]
+            ranked.sort(key=lambda item: (item[1], self._docs[item[0]]["created_at"] or datetime.min, item[0]), reverse=True)
+        page = ranked[offset:offset + limit]
+        if not page:
+            return []
+
+        docs = {
+            doc["post_id"]: doc
+            async for doc in collection.find({"post_id": {"$in": [post_id for post_id, _ in page]}}, projection)
+        }
+        return [(docs[post_id], score) for post_id, score in page if post_id in docs]
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {"backend": self.name, "built": self._built, "documents": len(self._docs), "terms": len(self._postings)}
+
+def create_search_backend(backend: Optional[str] = None) -> SearchBackend:
+    """POST_SEARCH_BACKEND 설정에 맞는 검색 백엔드 생성"""
+    backend = backend or POST_SEARCH_BACKEND
+    if backend == "memory":
+        return InMemorySearchBackend()
+    return MongoTextSearchBackend()
+
+# 전역 검색 백엔드 인스턴스
+post_search = create_search_backend()
@@ -0,0 +1,97 @@
+import csv
+import io
+import json
+from datetime import datetime
+from functools import lru_cache, partial
+from typing import Optional
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 직렬화 (결과는 동일, 속도만 차이)
+    orjson = None
+
+# 내보내기 CSV 컬럼 순서
+EXPORT_CSV_FIELDS = ["post_id", "title", "content", "status", "created_at", "updated_at", "images"]
+
+def json_default(value):
+    """json.dumps 기본 변환 (datetime은 API 응답과 같은 ISO 형식)"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def to_ndjson_line(document: dict) -> str:
+    """문서를 NDJSON 한 줄로 변환"""
+    return json.dumps(document, default=json_default, ensure_ascii=False) + "\n"
+
+def csv_header() -> str:
+    """내보내기 CSV 헤더 줄"""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(EXPORT_CSV_FIELDS)
+    return buffer.getvalue()
+
+def to_csv_row(document: dict) -> str:
+    """문서를 CSV 한 줄로 변환 (이미지는 파일명을 ';'로 연결)"""
+    row = []
+    for field in EXPORT_CSV_FIELDS:
+        value = document.get(field, "")
+        if field == "images":
+            value = ";".join(image["filename"] for image in value or [])
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        row.append(value)
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(row)
+    return buffer.getvalue()
+
+def dumps(value) -> bytes:
+    """JSON bytes 직렬화 (orjson 우선, 없으면 표준 json)"""
+    if orjson is not None:
+        return orjson.dumps(value, default=json_default)
+    return json.dumps(value, default=json_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def document_to_model_dict(model, document: dict, rename: Optional[dict] = None) -> dict:
+    """MongoDB 문서를 모델 인스턴스 생성 없이 응답 모델과 같은 모양의 dict로 변환
+
+    모델 필드 순서/기본값을 그대로 따르며, 중첩 모델 목록(예: images)은 재귀적으로 변환한다.
+    필수 필드가 문서에 없으면 KeyError.
+    """
+    return _convert(_field_plan(model, tuple(sorted((rename or {}).items()))), document)
+
+def _convert(plan: tuple, document: dict) -> dict:
+    result = {}
+    for name, key, required, default, nested_plan in plan:
+        if key in document:
+            value = document[key]
+        elif required:
+            raise KeyError(key)
+        else:
+            value = default()
+        if nested_plan is not None and isinstance(value, list):
+            value = [_convert(nested_plan, item) for item in value]
+        result[name] = value
+    return result
+
+@lru_cache(maxsize=None)
+def _field_plan(model, rename: tuple) -> tuple:
+    """모델별 (필드명, 문서 키, 필수 여부, 기본값 함수, 중첩 계획) 목록 (모델당 한 번만 계산)"""
+    rename = dict(rename)
+    plan = []
+    for name, field in model.model_fields.items():
+        nested = _nested_model(field.annotation)
+        plan.append((
+            name,
+            rename.get(name, name),
+            field.is_required(),
+            partial(field.get_default, call_default_factory=True),
+            _field_plan(nested, ()) if nested is not None else None
+        ))
+    return tuple(plan)
+
+def _nested_model(annotation):
+    """List[모델] 어노테이션이면 모델 클래스 반환"""
+    for arg in getattr(annotation, "__args__", ()):
+        if isinstance(arg, type) and issubclass(arg, BaseModel):
+            return arg
+    return None
@@ -0,0 +1,26 @@
+import os
+
+# 목록/캘린더용 요약 길이 (글자 수)
+POST_EXCERPT_LENGTH = int(os.getenv("POST_EXCERPT_LENGTH", "120"))
+
+def make_excerpt(content: str, length: int = POST_EXCERPT_LENGTH) -> str:
+    """본문 앞부분 요약 (공백 정리 후 단어 경계에서 자르고 말줄임표 추가)"""
+    text = " ".join((content or "").split())
+    if len(text) <= length:
+        return text
+    cut = text[:length]
+    # 단어 중간에서 잘리지 않도록 마지막 공백에서 자름 (너무 짧아지면 그대로 사용)
+    last_space = cut.rfind(" ")
+    if last_space > length // 2:
+        cut = cut[:last_space]
+    return cut.rstrip() + "…"
+
+def build_summary(post: dict) -> dict:
+    """글 문서의 content/images로 요약 필드 계산 (있는 필드에 해당하는 값만 반환)"""
+    summary = {}
+    if "content" in post:
+        summary["excerpt"] = make_excerpt(post["content"])
+        summary["word_count"] = len((post["content"] or "").split())
+    if "images" in post:
+        summary["image_count"] = len(post["images"] or [])
+    return summary
@@ -1,14 +1,28 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
-from backend.database import users, get_next_user_id
-from backend.auth_utils import get_password_hash, verify_password, create_access_token, verify_token
+from backend.database import users, get_next_user_id, duplicate_key_field
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from backend.auth_utils import (
+    get_password_hash_async, verify_password_async, create_access_token, verify_token,
+    password_hash_pool
+)
+from backend.cache import user_cache
 from datetime import datetime
 from bson import ObjectId
-from typing import Optional
+from typing import Optional, List, Union
+import json
 
 router = APIRouter()
 
+# 사용자 목록 페이지 설정
+DEFAULT_USER_PAGE_SIZE = 100
+MAX_USER_PAGE_SIZE = 1000
+USER_LIST_PROJECTION = {"password": 0}
+MAX_BATCH_LOOKUP = 200  # 일괄 조회 한 번에 허용하는 최대 키 수
+
 security = HTTPBearer()
 
 
@@ -34,6 +48,10 @@ class UserUpdate(BaseModel):
     birth_date: Optional[str] = None  # YYYY-MM-DD 형식으로 입력
     is_subscribe: Optional[bool] = None  # 구독 상태 변경
 
+class UserBatchRequest(BaseModel):
+    ids: List[Union[int, str]] = []  # 숫자 ID(정수/문자열) 또는 ObjectId 문자열
+    usernames: List[str] = []
+
 class UserResponse(BaseModel):
     id: str
     username: str
@@ -42,16 +60,43 @@ class UserResponse(BaseModel):
     is_subscribe: bool
     created_at: datetime
 
+def _user_response(user: dict) -> dict:
+    """사용자 문서를 응답용 dict로 변환 (패스워드 제외)"""
+    return {
+        "id": user.get("id", str(user["_id"])),  # 단순 ID 우선, 없으면 ObjectId
+        "username": user["username"],
+        "email": user["email"],
+        "birth_date": user.get("birth_date", ""),
+        "is_subscribe": user.get("is_subscribe", False),
+        "created_at": user["created_at"]
+    }
+
+def _parse_user_filter(user_id: str) -> dict:
+    """경로의 사용자 ID를 조회 조건으로 변환 (숫자 ID 우선, 아니면 ObjectId)"""
+    try:
+        return {"id": int(user_id)}
+    except ValueError:
+        if ObjectId.is_valid(user_id):
+            return {"_id": ObjectId(user_id)}
+        raise HTTPException(status_code=400, detail="잘못된 사용자 ID 형식입니다")
+
+def _json_default(value):
+    """json.dumps 기본 변환 (datetime은 일반 JSON 응답과 같은 ISO 형식)"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def _user_cache_keys(user: dict) -> list:
+    """사용자 문서가 캐시될 수 있는 모든 키 (숫자 ID, ObjectId, username)"""
+    keys = [f"oid:{user['_id']}", f"username:{user['username']}"]
+    if "id" in user:
+        keys.append(f"id:{user['id']}")
+    return keys
+
 @router.post("/register")
 async def register(user: UserCreate):
-    # 사용자 중복 체크 (username과 email 모두 확인)
-    if users.find_one({"username": user.username}):
-        raise HTTPException(status_code=400, detail="이미 존재하는 사용자입니다")
-    if users.find_one({"email": user.email}):
-        raise HTTPException(status_code=400, detail="이미 존재하는 이메일입니다")
-    
     # 패스워드 해싱
-    hashed_password = get_password_hash(user.password)
+    hashed_password = await get_password_hash_async(user.password)
     
     # 다음 단순 ID 생성
     simple_id = get_next_user_id()
@@ -67,8 +112,16 @@ async def register(user: UserCreate):
         "created_at": datetime.utcnow()
     }
     
-    # DB에 사용자 추가
-    result = users.insert_one(new_user)
+    # DB에 사용자 추가 (username/email 중복은 고유 인덱스로 검사)
+    try:
+        users.insert_one(new_user)
+    except DuplicateKeyError as e:
+        field = duplicate_key_field(e)
+        if field == "email":
+            raise HTTPException(status_code=400, detail="이미 존재하는 이메일입니다")
+        if field == "username":
+            raise HTTPException(status_code=400, detail="이미 존재하는 사용자입니다")
+        raise HTTPException(status_code=409, detail="사용자 생성 중 충돌이 발생했습니다. 다시 시도해주세요")
     
     return {"message": "회원가입이 완료되었습니다", "user_id": simple_id}
 
@@ -83,7 +136,7 @@ async def login(user_credentials: UserLogin):
         )
     
     # 패스워드 검증
-    if not verify_password(user_credentials.password, user["password"]):
+    if not await verify_password_async(user_credentials.password, user["password"]):
         raise HTTPException(
             status_code=400, 
             detail="이메일 또는 패스워드가 잘못되었습니다"
@@ -93,14 +146,7 @@ async def login(user_credentials: UserLogin):
     access_token = create_access_token(data={"sub": user["email"]})
     
     # 사용자 정보 (패스워드 제외)
-    user_info = {
-        "id": user.get("id", str(user["_id"])),  # 단순 ID 또는 기존 ObjectId
-        "username": user["username"],
-        "email": user["email"],
-        "birth_date": user.get("birth_date", ""),
-        "is_subscribe": user.get("is_subscribe", False),
-        "created_at": user["created_at"]
-    }
+    user_info = _user_response(user)
     
     return {
         "access_token": access_token,
@@ -108,24 +154,113 @@ async def login(user_credentials: UserLogin):
         "user_info": user_info
     }
 
+@router.get("/metrics/password-hashing")
+async def get_password_hashing_metrics():
+    """bcrypt 워커 풀 사용 현황 조회"""
+    return password_hash_pool.get_stats()
+
 @router.get("/users")
-async def get_all_users():
-    """모든 사용자 조회"""
-    all_users = list(users.find({}, {"password": 0}))  # 패스워드 제외하고 조회
-    user_list = []
+async def get_all_users(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_USER_PAGE_SIZE, description="페이지 크기 (기본 100, 스트리밍 시 미지정이면 전체)"),
+    after_id: Optional[str] = Query(None, description="이전 페이지의 next_cursor (마지막 사용자 _id)"),
+    stream: bool = Query(False, description="true이면 NDJSON으로 한 줄씩 스트리밍"),
+    count: str = Query("estimated", pattern="^(estimated|exact|none)$", description="total_count 계산 방식")
+):
+    """사용자 목록 조회 (_id 기준 커서 페이지네이션, NDJSON 스트리밍 지원)"""
+    # 숫자 id가 없는 기존 사용자도 빠지지 않도록 모든 문서에 있는 _id 순으로 조회 (기본 _id 인덱스 사용)
+    query = {}
+    if after_id is not None:
+        if not ObjectId.is_valid(after_id):
+            raise HTTPException(status_code=400, detail=f"잘못된 커서 형식입니다: {after_id}")
+        query["_id"] = {"$gt": ObjectId(after_id)}
     
-    for user in all_users:
-        user_data = {
-            "id": user.get("id", str(user["_id"])),  # 단순 ID 우선, 없으면 ObjectId
-            "username": user["username"],
-            "email": user["email"],
-            "birth_date": user.get("birth_date", ""),
-            "is_subscribe": user.get("is_subscribe", False),
-            "created_at": user["created_at"]
-        }
-        user_list.append(user_data)
+    if stream:
+        cursor = users.find(query, USER_LIST_PROJECTION).sort("_id", 1).batch_size(DEFAULT_USER_PAGE_SIZE)
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        
+        def generate():
+            # 동기 제너레이터는 스레드풀에서 순회되므로 이벤트 루프를 막지 않음
+            try:
+                for user in cursor:
+                    yield json.dumps(_user_response(user), default=_json_default, ensure_ascii=False) + "\n"
+            finally:
+                cursor.close()
+        
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
+    
+    page_size = limit or DEFAULT_USER_PAGE_SIZE
+    page = list(users.find(query, USER_LIST_PROJECTION).sort("_id", 1).limit(page_size + 1))
+    
+    next_cursor = None
+    if len(page) > page_size:
+        page = page[:page_size]
+        next_cursor = str(page[-1]["_id"])
+    user_list = [_user_response(user) for user in page]
+    
+    if count == "exact":
+        total_count = users.count_documents({})
+    elif count == "estimated":
+        total_count = users.estimated_document_count()  # 컬렉션 메타데이터 기반 (전체 스캔 없음)
+    else:
+        total_count = None
+    
+    return {"users": user_list, "total_count": total_count, "next_cursor": next_cursor}
+
+@router.post("/users/batch")
+async def get_users_batch(request: UserBatchRequest):
+    """여러 사용자 일괄 조회 (숫자 ID, ObjectId, username 혼합)
+    
+    중복을 제거한 뒤 캐시에 없는 사용자만 $in 쿼리 한 번으로 조회하고,
+    요청 순서대로 결과를 반환한다.
+    """
+    # 요청 키를 캐시 키 형태로 정규화 (요청 순서 유지, 중복 제거)
+    requested = {}  # 캐시 키 -> 요청에 쓰인 원래 값
+    for user_id in request.ids:
+        user_id_text = str(user_id)
+        try:
+            requested.setdefault(f"id:{int(user_id_text)}", user_id)
+        except ValueError:
+            if not ObjectId.is_valid(user_id_text):
+                raise HTTPException(status_code=400, detail=f"잘못된 사용자 ID 형식입니다: {user_id}")
+            requested.setdefault(f"oid:{ObjectId(user_id_text)}", user_id)
+    for username in request.usernames:
+        requested.setdefault(f"username:{username}", username)
+    
+    if len(requested) > MAX_BATCH_LOOKUP:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {MAX_BATCH_LOOKUP}명까지 조회할 수 있습니다")
     
-    return {"users": user_list, "total_count": len(user_list)}
+    found = await user_cache.get_many(list(requested))
+    
+    # 캐시에 없는 사용자만 한 번의 쿼리로 조회
+    missing = [key for key in requested if key not in found]
+    if missing:
+        simple_ids = [int(key[3:]) for key in missing if key.startswith("id:")]
+        object_ids = [ObjectId(key[4:]) for key in missing if key.startswith("oid:")]
+        usernames = [key[9:] for key in missing if key.startswith("username:")]
+        
+        conditions = []
+        if simple_ids:
+            conditions.append({"id": {"$in": simple_ids}})
+        if object_ids:
+            conditions.append({"_id": {"$in": object_ids}})
+        if usernames:
+            conditions.append({"username": {"$in": usernames}})
+        
+        missing_keys = set(missing)
+        fetched = {}
+        for user in users.find({"$or": conditions}, USER_LIST_PROJECTION):
+            user_data = _user_response(user)
+            for key in _user_cache_keys(user):
+                if key in missing_keys:
+                    fetched[key] = user_data
+        found.update(fetched)
+        await user_cache.set_many(fetched)
+    
+    return {
+        "users": [found[key] for key in requested if key in found],
+        "not_found": [value for key, value in requested.items() if key not in found]
+    }
 
 @router.get("/users/{user_id}")
 async def get_user_by_id(user_id: str):
@@ -134,25 +269,28 @@ async def get_user_by_id(user_id: str):
         # 단순 숫자 ID로 먼저 검색
         try:
             simple_id = int(user_id)
-            user = users.find_one({"id": simple_id})
+            user_filter = {"id": simple_id}
+            cache_key = f"id:{simple_id}"
         except ValueError:
             # 숫자가 아니면 ObjectId로 검색
             if ObjectId.is_valid(user_id):
-                user = users.find_one({"_id": ObjectId(user_id)})
+                user_filter = {"_id": ObjectId(user_id)}
+                cache_key = f"oid:{user_filter['_id']}"
             else:
-                user = None
+                raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
         
+        cached_user = await user_cache.get(cache_key)
+        if cached_user is not None:
+            return cached_user
+        
+        user = users.find_one(user_filter)
         if not user:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
         
-        return {
-            "id": user.get("id", str(user["_id"])),
-            "username": user["username"],
-            "email": user["email"],
-            "birth_date": user.get("birth_date", ""),
-            "is_subscribe": user.get("is_subscribe", False),
-            "created_at": user["created_at"]
-        }
+        user_data = _user_response(user)
+        await user_cache.set(cache_key, user_data)
+        
+        return user_data
     except HTTPException:
         raise
     except Exception as e:
@@ -161,62 +299,35 @@ async def get_user_by_id(user_id: str):
 @router.get("/users/username/{username}")
 async def get_user_by_username(username: str):
     """특정 사용자 조회 (username으로)"""
+    cached_user = await user_cache.get(f"username:{username}")
+    if cached_user is not None:
+        return cached_user
+    
     user = users.find_one({"username": username})
     
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
     
-    return {
-        "id": user.get("id", str(user["_id"])),
-        "username": user["username"],
-        "email": user["email"],
-        "birth_date": user.get("birth_date", ""),
-        "is_subscribe": user.get("is_subscribe", False),
-        "created_at": user["created_at"]
-    }
+    user_data = _user_response(user)
+    await user_cache.set(f"username:{username}", user_data)
+    
+    return user_data
 
 @router.put("/users/{user_id}")
 async def update_user(user_id: str, user_update: UserUpdate):
-    """사용자 정보 수정"""
+    """사용자 정보 수정 (find_one_and_update 한 번으로 처리)"""
     try:
-        # 단순 숫자 ID로 먼저 검색, 실패하면 ObjectId로 검색
-        user_filter = None
-        try:
-            simple_id = int(user_id)
-            user_filter = {"id": simple_id}
-        except ValueError:
-            if ObjectId.is_valid(user_id):
-                user_filter = {"_id": ObjectId(user_id)}
-            else:
-                raise HTTPException(status_code=400, detail="잘못된 사용자 ID 형식입니다")
-        
-        # 기존 사용자 확인
-        existing_user = users.find_one(user_filter)
-        if not existing_user:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
+        user_filter = _parse_user_filter(user_id)
         
         # 업데이트할 데이터 준비 (None이 아닌 값만)
         update_data = {}
         if user_update.username is not None:
-            # username 중복 체크 (다른 사용자와)
-            if "id" in existing_user:
-                duplicate_user = users.find_one({
-                    "username": user_update.username,
-                    "id": {"$ne": existing_user["id"]}
-                })
-            else:
-                duplicate_user = users.find_one({
-                    "username": user_update.username,
-                    "_id": {"$ne": existing_user["_id"]}
-                })
-            
-            if duplicate_user:
-                raise HTTPException(status_code=400, detail="이미 존재하는 사용자명입니다")
+            # username 중복은 고유 인덱스로 검사
             update_data["username"] = user_update.username
             
         if user_update.password is not None:
             # 패스워드 해싱
-            update_data["password"] = get_password_hash(user_update.password)
+            update_data["password"] = await get_password_hash_async(user_update.password)
             
         if user_update.email is not None:
             update_data["email"] = user_update.email
@@ -234,25 +345,33 @@ async def update_user(user_id: str, user_update: UserUpdate):
         update_data["updated_at"] = datetime.utcnow()
         
         # 사용자 정보 업데이트
-        result = users.update_one(user_filter, {"$set": update_data})
+        # 변경 전 username으로 캐시된 항목도 지워야 하므로 수정 전 문서를 받고,
+        # 응답용 수정 후 문서는 $set 내용을 덮어써서 만든다 (추가 조회 없음)
+        try:
+            previous_user = users.find_one_and_update(
+                user_filter,
+                {"$set": update_data},
+                projection=USER_LIST_PROJECTION,
+                return_document=ReturnDocument.BEFORE
+            )
+        except DuplicateKeyError as e:
+            if duplicate_key_field(e) == "email":
+                raise HTTPException(status_code=400, detail="이미 존재하는 이메일입니다")
+            raise HTTPException(status_code=400, detail="이미 존재하는 사용자명입니다")
+        
+        if not previous_user:
+            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
         
-        if result.modified_count == 0:
-            raise HTTPException(status_code=400, detail="사용자 정보 수정에 실패했습니다")
+        update_data.pop("password", None)
+        updated_user = {**previous_user, **update_data}
         
-        # 업데이트된 사용자 정보 반환
-        updated_user = users.find_one(user_filter)
-        if not updated_user:
-            raise HTTPException(status_code=500, detail="업데이트 후 사용자 정보를 찾을 수 없습니다")
+        # 모든 워커의 캐시 무효화 (변경 전 username 포함)
+        await user_cache.delete(*_user_cache_keys(previous_user))
         
         return {
             "message": "사용자 정보가 수정되었습니다",
             "user": {
-                "id": updated_user.get("id", str(updated_user["_id"])),
-                "username": updated_user["username"],
-                "email": updated_user["email"],
-                "birth_date": updated_user.get("birth_date", ""),
-                "is_subscribe": updated_user.get("is_subscribe", False),
-                "created_at": updated_user["created_at"],
+                **_user_response(updated_user),
                 "updated_at": updated_user.get("updated_at")
             }
         }
@@ -266,34 +385,22 @@ async def update_user(user_id: str, user_update: UserUpdate):
 async def delete_user(user_id: str):
     """사용자 삭제"""
     try:
-        # 단순 숫자 ID로 먼저 검색, 실패하면 ObjectId로 검색
-        user_filter = None
-        try:
-            simple_id = int(user_id)
-            user_filter = {"id": simple_id}
-        except ValueError:
-            if ObjectId.is_valid(user_id):
-                user_filter = {"_id": ObjectId(user_id)}
-            else:
-                raise HTTPException(status_code=400, detail="잘못된 사용자 ID 형식입니다")
+        user_filter = _parse_user_filter(user_id)
         
-        # 기존 사용자 확인
-        existing_user = users.find_one(user_filter)
-        if not existing_user:
+        # 조회와 삭제를 한 번에 처리
+        deleted_user = users.find_one_and_delete(user_filter, projection=USER_LIST_PROJECTION)
+        if not deleted_user:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
         
-        # 사용자 삭제
-        result = users.delete_one(user_filter)
-        
-        if result.deleted_count == 0:
-            raise HTTPException(status_code=400, detail="사용자 삭제에 실패했습니다")
+        # 모든 워커의 캐시 무효화
+        await user_cache.delete(*_user_cache_keys(deleted_user))
         
         return {
             "message": "사용자가 삭제되었습니다",
             "deleted_user": {
-                "id": existing_user.get("id", str(existing_user["_id"])),
-                "username": existing_user["username"],
-                "email": existing_user["email"]
+                "id": deleted_user.get("id", str(deleted_user["_id"])),
+                "username": deleted_user["username"],
+                "email": deleted_user["email"]
             }
         }
         
@@ -305,23 +412,19 @@ async def delete_user(user_id: str):
 @router.delete("/users/username/{username}")
 async def delete_user_by_username(username: str):
     """사용자 삭제 (username으로)"""
-    # 기존 사용자 확인
-    existing_user = users.find_one({"username": username})
-    if not existing_user:
+    # 조회와 삭제를 한 번에 처리
+    deleted_user = users.find_one_and_delete({"username": username}, projection=USER_LIST_PROJECTION)
+    if not deleted_user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
     
-    # 사용자 삭제
-    result = users.delete_one({"username": username})
-    
-    if result.deleted_count == 0:
-        raise HTTPException(status_code=400, detail="사용자 삭제에 실패했습니다")
+    # 모든 워커의 캐시 무효화
+    await user_cache.delete(*_user_cache_keys(deleted_user))
     
     return {
         "message": "사용자가 삭제되었습니다",
         "deleted_user": {
-            "id": existing_user.get("id", str(existing_user["_id"])),
-            "username": existing_user["username"],
-            "email": existing_user["email"]
+            "id": deleted_user.get("id", str(deleted_user["_id"])),
+            "username": deleted_user["username"],
+            "email": deleted_user["email"]
         }
     }
-
@@ -0,0 +1,46 @@
+"""
+verify_token 캐시 성능 비교 벤치마크
+
+같은 토큰을 반복 검증할 때 캐시 미사용(매번 HMAC 검증 + JSON 디코딩)과
+캐시 사용(다이제스트 조회)의 처리량을 비교합니다.
+
+사용법:
+    python bench_verify_token.py [반복 횟수]
+"""
+
+import sys
+import time
+
+from backend.auth_utils import create_access_token, verify_token, verified_token_cache
+
+def run(token: str, iterations: int) -> float:
+    """verify_token을 iterations번 호출하고 초당 처리량을 반환"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        verify_token(token)
+    elapsed = time.perf_counter() - start
+    return iterations / elapsed
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    token = create_access_token(data={"sub": "bench@example.com"})
+    
+    print(f"verify_token 벤치마크 ({iterations}회 반복)\n")
+    
+    # 1. 캐시 미사용
+    verified_token_cache.enabled = False
+    uncached = run(token, iterations)
+    print(f"캐시 미사용: {uncached:,.0f} ops/s ({1_000_000 / uncached:.2f} us/op)")
+    
+    # 2. 캐시 사용 (첫 호출에서 캐시 채움)
+    verified_token_cache.enabled = True
+    verified_token_cache.clear()
+    verify_token(token)
+    cached = run(token, iterations)
+    print(f"캐시 사용:   {cached:,.0f} ops/s ({1_000_000 / cached:.2f} us/op)")
+    
+    print(f"\n속도 향상: {cached / uncached:.1f}배")
+    print(f"캐시 통계: {verified_token_cache.get_stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+캐시 백엔드 테스트 (fakeredis 사용, Redis 서버 불필요)
+
+같은 FakeServer를 공유하는 RedisCacheBackend 두 개를 워커 두 개로 보고
+저장/조회/무효화가 서로에게 반영되는지, 무효화 직후 이전 값이 다시 저장되지 않는지 확인합니다.
+
+사용법:
+    python -m pytest -q test_cache_backend.py
+"""
+
+import asyncio
+
+import pytest
+
+from backend.cache import CacheBackend, InMemoryCacheBackend, RedisCacheBackend
+
+fakeredis = pytest.importorskip("fakeredis")
+
+def make_workers(count: int = 2):
+    """같은 Redis를 공유하는 워커별 캐시 백엔드 생성"""
+    server = fakeredis.FakeServer()
+    return [
+        RedisCacheBackend("posts", fakeredis.aioredis.FakeRedis(server=server, decode_responses=True),
+                          max_size=16, ttl_seconds=60)
+        for _ in range(count)
+    ]
+
+async def wait_for_listeners(*caches):
+    """무효화 구독이 시작될 때까지 대기"""
+    for cache in caches:
+        cache._ensure_listener()
+    for _ in range(100):
+        counts = await caches[0].client.pubsub_numsub(caches[0].channel)
+        if counts and counts[0][1] >= len(caches):
+            return
+        await asyncio.sleep(0.01)
+
+def test_cache_backend_is_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend("posts")
+
+def test_set_get_delete_across_workers():
+    async def scenario():
+        first, second = make_workers()
+        try:
+            await wait_for_listeners(first, second)
+
+            await first.set("p1", {"title": "v1"})
+            assert await first.get("p1") == {"title": "v1"}
+            # 다른 워커는 Redis에서 읽어 L1에 올림
+            assert await second.get("p1") == {"title": "v1"}
+            assert second.remote_hits == 1
+
+            await first.delete("p1")
+            for _ in range(100):
+                if second.invalidations_received:
+                    break
+                await asyncio.sleep(0.01)
+            assert second.invalidations_received == 1
+            assert await first.get("p1") is None
+            assert await second.get("p1") is None
+
+            assert await second.get_many(["p1"]) == {}
+        finally:
+            await first.close()
+            await second.close()
+
+    asyncio.run(scenario())
+
+def test_stale_set_after_delete_is_ignored():
+    async def scenario():
+        first, second = make_workers()
+        try:
+            # second가 DB에서 이전 값을 읽은 뒤 first가 글을 수정하고 무효화
+            await first.delete("p1")
+            # 늦게 도착한 second의 저장은 무시되어야 함
+            await second.set("p1", {"title": "stale"})
+            assert await second.get("p1") is None
+            assert await first.get("p1") is None
+        finally:
+            await first.close()
+            await second.close()
+
+    asyncio.run(scenario())
+
+def test_in_memory_stale_set_after_delete_is_ignored():
+    async def scenario():
+        cache = InMemoryCacheBackend("posts", max_size=16, ttl_seconds=60)
+        await cache.set("p1", {"title": "v1"})
+        assert await cache.get("p1") == {"title": "v1"}
+
+        await cache.delete("p1")
+        await cache.set("p1", {"title": "stale"})
+        assert await cache.get("p1") is None
+
+    asyncio.run(scenario())
+
+def test_set_many_across_workers():
+    async def scenario():
+        first, second = make_workers()
+        try:
+            await first.delete("p2")
+            await first.set_many({"p1": {"title": "v1"}, "p2": {"title": "stale"}})
+            # 무효화 표식이 있는 p2는 저장되지 않음
+            assert await second.get_many(["p1", "p2"]) == {"p1": {"title": "v1"}}
+        finally:
+            await first.close()
+            await second.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,90 @@
+"""
+응답 직렬화 테스트 (MongoDB 불필요)
+
+글 목록/상세 빠른 경로(document_to_model_dict + dumps)가 응답 모델을 거치는
+기존 경로(jsonable_encoder(모델(**문서)))와 같은 JSON을 만드는지 확인합니다.
+
+사용법:
+    python -m pytest -q test_serialization.py
+"""
+
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+
+from backend.post.models.post import PostListResponse, PostDetailResponse
+from backend.post.utils import serialization
+from backend.post.utils.serialization import document_to_model_dict, dumps
+from backend.post.utils.summary import build_summary
+
+def make_image(filename: str, derivatives: bool = False) -> dict:
+    image = {
+        "filename": filename,
+        "original_filename": "원본 사진.jpg",
+        "file_path": f"uploads/{filename}",
+        "file_size": 20480,
+        "upload_date": datetime(2025, 3, 1, 9, 30, 15, 250000)
+    }
+    if derivatives:
+        image["derivatives"] = [
+            {"name": name, "filename": f"{name}_{filename}", "file_path": f"uploads/{name}_{filename}",
+             "width": width, "height": width * 3 // 4, "file_size": width * 10, "format": "WEBP"}
+            for name, width in (("thumb", 200), ("medium", 800))
+        ]
+    return image
+
+def make_document(**overrides) -> dict:
+    """create_post_document와 같은 모양의 저장 문서"""
+    document = {
+        "_id": ObjectId(),
+        "post_id": "0b7c5f1e-2f44-4b1a-9c2e-3d1f0a9e8b77",
+        "title": "제목",
+        "content": "본문 내용입니다. " * 20,
+        "status": "published",
+        "images": [],
+        "created_at": datetime(2025, 3, 1, 9, 30, 15, 123000),
+        "updated_at": datetime(2025, 3, 2, 10, 0, 0)
+    }
+    document.update(overrides)
+    document.update(build_summary(document))
+    return document
+
+def make_legacy_document() -> dict:
+    """요약 필드(excerpt/word_count/image_count)와 derivatives가 없는 이전 문서"""
+    document = make_document(images=[make_image("legacy.jpg")])
+    for field in ("excerpt", "word_count", "image_count"):
+        del document[field]
+    return document
+
+DOCUMENTS = {
+    "current": make_document(),
+    "legacy": make_legacy_document(),
+    "derivatives": make_document(images=[make_image("a.jpg", derivatives=True), make_image("b.png")]),
+    "deleted": make_document(status="deleted", content="짧은 글"),
+}
+
+@pytest.fixture(params=["orjson", "json"])
+def json_library(request, monkeypatch):
+    """orjson이 있을 때와 없을 때(표준 json) 모두 확인"""
+    if request.param == "orjson":
+        if serialization.orjson is None:
+            pytest.skip("orjson 미설치")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+@pytest.mark.parametrize("model", [PostListResponse, PostDetailResponse])
+@pytest.mark.parametrize("name", sorted(DOCUMENTS))
+def test_fast_path_matches_response_model(json_library, model, name):
+    document = DOCUMENTS[name]
+    fast = dumps(document_to_model_dict(model, document, rename={"id": "post_id"}))
+    expected = dumps(jsonable_encoder(model(**{**document, "id": document["post_id"]})))
+    assert fast == expected
+
+def test_missing_required_field_raises():
+    document = make_document()
+    del document["title"]
+    with pytest.raises(KeyError):
+        document_to_model_dict(PostListResponse, document, rename={"id": "post_id"})
@@ -0,0 +1,53 @@
+"""
+사용자 일괄 조회(POST /api/auth/users/batch) 테스트 (mongomock 사용, MongoDB 불필요)
+
+회원가입/로그인 응답의 숫자 ID를 그대로(정수로) 보내도 조회되는지,
+문자열 ID/ObjectId/username을 섞어 보내도 요청 순서대로 반환되는지 확인합니다.
+
+사용법:
+    python -m pytest -q test_user_batch.py
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.cache import InMemoryCacheBackend
+from backend.routes import auth
+
+mongomock = pytest.importorskip("mongomock")
+
+@pytest.fixture
+def client(monkeypatch):
+    users = mongomock.MongoClient()["mini_project"]["users"]
+    for user_id in (1, 2, 3):
+        users.insert_one({
+            "id": user_id, "username": f"user{user_id}", "email": f"user{user_id}@example.com",
+            "password": "hashed", "created_at": datetime(2025, 1, user_id)
+        })
+    monkeypatch.setattr(auth, "users", users)
+    monkeypatch.setattr(auth, "user_cache", InMemoryCacheBackend("users", max_size=16, ttl_seconds=60))
+
+    app = FastAPI()
+    app.include_router(auth.router, prefix="/api/auth")
+    return TestClient(app)
+
+def test_batch_accepts_integer_ids(client):
+    response = client.post("/api/auth/users/batch", json={"ids": [3, 1, 99]})
+    assert response.status_code == 200
+    body = response.json()
+    assert [user["id"] for user in body["users"]] == [3, 1]
+    assert body["not_found"] == [99]
+
+def test_batch_accepts_mixed_ids_and_usernames(client):
+    response = client.post("/api/auth/users/batch", json={"ids": ["2", 1], "usernames": ["user3", "nobody"]})
+    assert response.status_code == 200
+    body = response.json()
+    assert [user["username"] for user in body["users"]] == ["user2", "user1", "user3"]
+    assert body["not_found"] == ["nobody"]
+
+def test_batch_rejects_invalid_id(client):
+    response = client.post("/api/auth/users/batch", json={"ids": ["not-an-id"]})
+    assert response.status_code == 400
@@ -0,0 +1,62 @@
+"""
+사용자 ID 할당기(hi/lo) 동시성 스트레스 테스트
+
+여러 프로세스(워커)와 각 프로세스 내 여러 스레드에서 동시에 ID를 발급받아
+중복이 없는지 확인합니다. 실제 사용자 카운터와 섞이지 않도록 별도 카운터를 사용합니다.
+
+사용법 (MongoDB 실행 필요):
+    python test_user_id_allocator.py [프로세스 수] [스레드 수] [스레드당 발급 수]
+"""
+
+import sys
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+
+STRESS_COUNTER_NAME = "user_id_stress_test"
+
+def allocate_in_worker(args):
+    """한 워커 프로세스에서 여러 스레드로 ID를 발급받아 목록 반환"""
+    threads, per_thread, block_size = args
+    from backend.database import counters, UserIdAllocator
+    
+    allocator = UserIdAllocator(counters, counter_name=STRESS_COUNTER_NAME, block_size=block_size)
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        chunks = executor.map(lambda _: [allocator.next_id() for _ in range(per_thread)], range(threads))
+    return [user_id for chunk in chunks for user_id in chunk]
+
+def main():
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    per_thread = int(sys.argv[3]) if len(sys.argv) > 3 else 500
+    block_size = 20
+    
+    from backend.database import counters
+    counters.delete_one({"_id": STRESS_COUNTER_NAME})
+    
+    print(f"ID 할당 스트레스 테스트: 프로세스 {processes}개 x 스레드 {threads}개 x {per_thread}회")
+    
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(processes) as pool:
+        results = pool.map(allocate_in_worker, [(threads, per_thread, block_size)] * processes)
+    
+    all_ids = [user_id for worker_ids in results for user_id in worker_ids]
+    expected = processes * threads * per_thread
+    unique = len(set(all_ids))
+    
+    counter_doc = counters.find_one({"_id": STRESS_COUNTER_NAME})
+    reserved = counter_doc["sequence_value"] if counter_doc else 0
+    counters.delete_one({"_id": STRESS_COUNTER_NAME})
+    
+    print(f"발급된 ID: {len(all_ids)}개 (기대값 {expected}개)")
+    print(f"고유 ID: {unique}개")
+    print(f"예약된 최대 ID: {reserved} (빈 번호 {reserved - unique}개)")
+    print(f"카운터 왕복 횟수: 약 {reserved // block_size}회 (블록 없이 {expected}회)")
+    
+    if unique == expected == len(all_ids):
+        print("[OK] 중복 없이 모든 ID가 발급되었습니다")
+    else:
+        print("[ERROR] 중복 ID가 발견되었습니다")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()